@@ -6,6 +6,9 @@ CLI="$ROOT/tools/bin/yai-govern"
 SRC_ID="src.sample.digital-outbound"
 NORM_ID="norm.src-sample-digital-outbound"
 CID="enterprise.sample.src-sample-digital-outbound.candidate.v1"
+CSV_SRC_ID="src.sample.csv-sheet"
+CSV_NORM_ID="norm.src-sample-csv-sheet"
+CSV_CID="enterprise.sample.src-sample-csv-sheet.candidate.v1"
 
 "$CLI" source inspect "$SRC_ID" >/dev/null
 "$CLI" parse "$SRC_ID" >/dev/null
@@ -18,4 +21,12 @@ CID="enterprise.sample.src-sample-digital-outbound.candidate.v1"
 "$CLI" review status "$CID" >/dev/null
 "$CLI" status "$CID" >/dev/null
 
+# csv_rule_sheet goes through the lazily loaded format handler; validate checks
+# the source manifest against the schema the engine loads.
+"$CLI" source inspect "$CSV_SRC_ID" >/dev/null
+"$CLI" parse "$CSV_SRC_ID" >/dev/null
+"$CLI" normalize "$CSV_SRC_ID" >/dev/null
+"$CLI" build "$CSV_NORM_ID" >/dev/null
+"$CLI" validate "$CSV_CID" >/dev/null
+
 echo "integration_ingestion_pipeline: ok"
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import random
+import resource
+import shlex
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools" / "gen"))
+
+import deterministic_governance_ingestion as engine  # noqa: E402
+
+FORMATS = {
+    "markdown": ("markdown_rule_sheet", "md"),
+    "yaml": ("yaml_rule_sheet", "yaml"),
+    "json": ("json_rule_sheet", "json"),
+}
+ATTR_KEYS = ["action", "target", "sink", "mode", "severity", "evidence", "role", "scope", "rationale"]
+
+
+def _synthetic_statements(count: int, quoted_ratio: float, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    fact_types = sorted(engine.KNOWN_FACT_TYPES)
+    out: List[str] = []
+    for i in range(count):
+        tokens = ["RULE", rng.choice(fact_types)]
+        for key in rng.sample(ATTR_KEYS, rng.randint(1, 5)):
+            tokens.append(f"{key}=v{i % 97}_{key}")
+        if rng.random() < quoted_ratio:
+            tokens.append('note="quoted value"')
+        out.append(" ".join(tokens))
+    return out
+
+
+def _synthetic_rules(
+    count: int,
+    fact_types: List[str],
+    unknown_ratio: float,
+    invalid_ratio: float,
+    quoted_ratio: float,
+    seed: int,
+) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    rules: List[Dict[str, str]] = []
+    for i in range(count):
+        fact_type = rng.choice(fact_types)
+        if rng.random() < unknown_ratio:
+            fact_type = f"synthetic_unknown_{i % 7}"
+        rule = {"fact_type": fact_type}
+        for key in rng.sample(ATTR_KEYS, rng.randint(1, 5)):
+            rule[key] = f"v{i % 97}_{key}"
+        if rng.random() < quoted_ratio:
+            rule["note"] = "quoted value"
+        if rng.random() < invalid_ratio:
+            rule[""] = "orphan"
+        rules.append(rule)
+    return rules
+
+
+def _rule_statement(rule: Dict[str, str]) -> str:
+    tokens = ["RULE", rule["fact_type"]]
+    for key, value in rule.items():
+        if key == "fact_type":
+            continue
+        tokens.append(f'{key}="{value}"' if " " in value else f"{key}={value}")
+    return " ".join(tokens)
+
+
+def synthetic_sheet(fmt: str, rules: List[Dict[str, str]]) -> str:
+    if fmt == "markdown":
+        lines = ["# Synthetic rule sheet", ""]
+        lines.extend(f"- {_rule_statement(r)}" for r in rules)
+        return "\n".join(lines) + "\n"
+    if fmt == "yaml":
+        lines = ["rules:"]
+        lines.extend(f"  - {_rule_statement(r)}" for r in rules)
+        return "\n".join(lines) + "\n"
+    if fmt == "json":
+        return json.dumps({"rules": rules}, indent=2, ensure_ascii=True) + "\n"
+    raise ValueError(f"unsupported format: {fmt}")
+
+
+def _write_scenario_source(work: Path, fmt: str, rules: List[Dict[str, str]]) -> Path:
+    source_format, ext = FORMATS[fmt]
+    payload = work / f"synthetic.{ext}"
+    payload.write_text(synthetic_sheet(fmt, rules), encoding="utf-8")
+    source = {
+        "kind": "enterprise_governance_source",
+        "schema_version": "v1",
+        "source_id": f"src.bench.{fmt}",
+        "title": f"Synthetic {fmt} rule sheet",
+        "owner": {"organization_id": "bench"},
+        "domain_targets": ["digital"],
+        "source_format": source_format,
+        "source_payload_ref": str(payload),
+        "confidence_hint": 1.0,
+    }
+    source_path = work / f"src.bench.{fmt}.source.v1.json"
+    source_path.write_text(json.dumps(source, indent=2), encoding="utf-8")
+    return source_path
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        idx = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return round(ordered[idx] * 1000.0, 3)
+
+    return {"p50_ms": pick(0.50), "p90_ms": pick(0.90), "p99_ms": pick(0.99), "max_ms": pick(1.0)}
+
+
+def _timed(samples: List[float], fn: Callable[[], Any]) -> Any:
+    started = time.perf_counter()
+    result = fn()
+    samples.append(time.perf_counter() - started)
+    return result
+
+
+def _run_scenario(config: Dict[str, Any]) -> Dict[str, Any]:
+    # Runs in a fresh (spawned) interpreter so ru_maxrss is this scenario's peak.
+    fmt = config["format"]
+    rules = _synthetic_rules(
+        config["statements"],
+        config["fact_types"],
+        config["unknown_ratio"],
+        config["invalid_ratio"],
+        config["quoted_ratio"],
+        config["seed"],
+    )
+    stages: Dict[str, List[float]] = {"parse": [], "normalize": [], "build-candidate": [], "validate": [], "pipeline": []}
+    with tempfile.TemporaryDirectory(prefix="yai-ingest-bench-") as tmp:
+        work = Path(tmp)
+        engine.INGESTION_DIR = work / "ingestion"
+        engine.CACHE_DIR = engine.INGESTION_DIR / "cache"
+        source_path = _write_scenario_source(work, fmt, rules)
+        del rules
+        validate = config["validate"] and all(
+            p.exists() for p in (engine.SOURCE_SCHEMA, engine.PARSED_SCHEMA, engine.NORMALIZED_SCHEMA, engine.CANDIDATE_SCHEMA)
+        )
+        for _ in range(config["repeat"]):
+            parsed = _timed(stages["parse"], lambda: engine._parse(source_path, None, True))
+            normalized = _timed(stages["normalize"], lambda: engine._normalize(source_path, parsed, None, True))
+            candidate = _timed(
+                stages["build-candidate"], lambda: engine._build_candidate(source_path, normalized, None, True)
+            )
+            if validate:
+                _timed(stages["validate"], lambda: engine._validate_checks(source_path, parsed, normalized, candidate))
+            _timed(stages["pipeline"], lambda: engine._run(source_path, "sync", True))
+        coverage = json.loads(parsed.read_text(encoding="utf-8"))["coverage_summary"]
+
+    pipeline_p50 = sorted(stages["pipeline"])[len(stages["pipeline"]) // 2]
+    return {
+        "format": fmt,
+        "statements": config["statements"],
+        "coverage": coverage,
+        "statements_per_sec": round(config["statements"] / pipeline_p50, 1) if pipeline_p50 else None,
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "stages": {name: _percentiles(samples) for name, samples in stages.items() if samples},
+    }
+
+
+def bench_pipeline(
+    formats: List[str],
+    sizes: List[int],
+    fact_types: List[str],
+    unknown_ratio: float,
+    invalid_ratio: float,
+    quoted_ratio: float,
+    repeat: int,
+    validate: bool,
+    seed: int,
+) -> Dict[str, Any]:
+    ctx = multiprocessing.get_context("spawn")
+    scenarios: List[Dict[str, Any]] = []
+    for fmt in formats:
+        for size in sizes:
+            config = {
+                "format": fmt,
+                "statements": size,
+                "fact_types": fact_types,
+                "unknown_ratio": unknown_ratio,
+                "invalid_ratio": invalid_ratio,
+                "quoted_ratio": quoted_ratio,
+                "repeat": repeat,
+                "validate": validate,
+                "seed": seed,
+            }
+            with ctx.Pool(1) as pool:
+                scenarios.append(pool.apply(_run_scenario, (config,)))
+    return {
+        "benchmark": "pipeline",
+        "engine_version": engine.ENGINE_VERSION,
+        "python": sys.version.split()[0],
+        "config": {
+            "formats": formats,
+            "sizes": sizes,
+            "fact_types": fact_types,
+            "unknown_ratio": unknown_ratio,
+            "invalid_ratio": invalid_ratio,
+            "quoted_ratio": quoted_ratio,
+            "repeat": repeat,
+            "validate": validate,
+            "seed": seed,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def _best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_tokenizer(count: int, quoted_ratio: float, repeat: int, seed: int) -> Dict[str, Any]:
+    statements = _synthetic_statements(count, quoted_ratio, seed)
+    for st in statements:
+        if engine._tokenize_rule_statement(st) != shlex.split(st):
+            raise SystemExit(f"bench_governance_ingestion: tokenizer mismatch: {st}")
+
+    shlex_s = _best_of(repeat, lambda: [shlex.split(st) for st in statements])
+    fast_s = _best_of(repeat, lambda: [engine._tokenize_rule_statement(st) for st in statements])
+    return {
+        "benchmark": "tokenizer",
+        "statements": count,
+        "quoted_ratio": quoted_ratio,
+        "repeat": repeat,
+        "shlex_seconds": round(shlex_s, 6),
+        "fast_path_seconds": round(fast_s, 6),
+        "shlex_statements_per_sec": round(count / shlex_s, 1) if shlex_s else None,
+        "fast_path_statements_per_sec": round(count / fast_s, 1) if fast_s else None,
+        "speedup": round(shlex_s / fast_s, 2) if fast_s else None,
+    }
+
+
+CONFLICT_FACT_TYPES = ["sink_restricted", "outbound_restriction", "approval_required", "publication_restriction"]
+CONFLICT_MODES = ["deny", "allow_reviewed", "quarantine", ""]
+
+
+def _synthetic_parsed(count: int, seed: int) -> Dict[str, Any]:
+    # About sqrt(count) targets so every (target, scope) bucket holds several
+    # facts and the conflict index has real work to do.
+    rng = random.Random(seed)
+    targets = max(1, int(count ** 0.5))
+    facts: List[Dict[str, Any]] = []
+    for i in range(count):
+        fact_type = rng.choice(CONFLICT_FACT_TYPES)
+        attrs = {"target": f"t{rng.randrange(targets)}"}
+        mode = rng.choice(CONFLICT_MODES)
+        if mode and fact_type != "approval_required":
+            attrs["mode"] = mode
+        facts.append(
+            {
+                "fact_id": f"fact-{i + 1:04d}",
+                "fact_type": fact_type,
+                "status": "parsed",
+                "attributes": attrs,
+                "scope_hint": rng.choice(["digital", "finance"]),
+            }
+        )
+    return {"facts": facts, "unresolved_items": []}
+
+
+def _pairwise_conflict_count(parsed: Dict[str, Any]) -> int:
+    # The naive alternative: compare every pair of restriction candidates.
+    rows = []
+    for fact in parsed["facts"]:
+        attrs = fact["attributes"]
+        rows.append((fact["fact_type"], attrs.get("target"), fact.get("scope_hint"), attrs.get("mode")))
+    found = 0
+    for i, a in enumerate(rows):
+        for b in rows[i + 1 :]:
+            if a[:3] == b[:3] and a[3] and b[3] and a[3] != b[3]:
+                found += 1
+    return found
+
+
+def bench_conflicts(sizes: List[int], repeat: int, pairwise_max: int, seed: int) -> Dict[str, Any]:
+    scenarios: List[Dict[str, Any]] = []
+    for size in sizes:
+        parsed = _synthetic_parsed(size, seed)
+        hints: List[Dict[str, Any]] = []
+
+        def indexed() -> None:
+            state = engine._NormalizeState()
+            engine._normalize_facts(state, parsed)
+            hints[:] = engine._conflict_hints(state)
+
+        indexed_s = _best_of(repeat, indexed)
+        scenario: Dict[str, Any] = {
+            "candidates": size,
+            "conflict_hints": len(hints),
+            "indexed_seconds": round(indexed_s, 6),
+            "indexed_ns_per_candidate": round(indexed_s / size * 1e9, 1) if size else None,
+            "pairwise_seconds": None,
+        }
+        if size <= pairwise_max:
+            scenario["pairwise_seconds"] = round(_best_of(1, lambda: _pairwise_conflict_count(parsed)), 6)
+        scenarios.append(scenario)
+    return {
+        "benchmark": "conflicts",
+        "engine_version": engine.ENGINE_VERSION,
+        "python": sys.version.split()[0],
+        "config": {"sizes": sizes, "repeat": repeat, "pairwise_max": pairwise_max, "seed": seed},
+        "scenarios": scenarios,
+    }
+
+
+def _parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Governance ingestion engine benchmarks")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    p_tok = sub.add_parser("tokenizer", help="RULE statement tokenizer vs shlex.split")
+    p_tok.add_argument("--statements", type=int, default=50000)
+    p_tok.add_argument("--quoted-ratio", type=float, default=0.05)
+    p_tok.add_argument("--repeat", type=int, default=5)
+    p_tok.add_argument("--seed", type=int, default=1)
+
+    def add_mix(sp: argparse.ArgumentParser) -> None:
+        sp.add_argument("--formats", default="markdown,yaml,json", help="comma list of markdown,yaml,json")
+        sp.add_argument("--fact-types", default="", help="comma list of known fact types to draw from (default: all)")
+        sp.add_argument("--unknown-ratio", type=float, default=0.05)
+        sp.add_argument("--invalid-ratio", type=float, default=0.02)
+        sp.add_argument("--quoted-ratio", type=float, default=0.05)
+        sp.add_argument("--seed", type=int, default=1)
+
+    p_gen = sub.add_parser("generate", help="write synthetic rule sheets")
+    p_gen.add_argument("--statements", type=int, default=10000)
+    p_gen.add_argument("--out-dir", required=True, type=Path)
+    add_mix(p_gen)
+
+    p_pipe = sub.add_parser("pipeline", help="per-stage and full-pipeline throughput on synthetic sheets")
+    p_pipe.add_argument("--sizes", default="1000,10000", help="comma list of statement counts")
+    p_pipe.add_argument("--repeat", type=int, default=5)
+    p_pipe.add_argument("--no-validate", action="store_true", help="skip the schema validation stage")
+    p_pipe.add_argument("--out", type=Path, help="write the JSON report here instead of stdout")
+    add_mix(p_pipe)
+
+    p_conf = sub.add_parser("conflicts", help="normalize + conflict hints over synthetic restriction candidates")
+    p_conf.add_argument("--sizes", default="1000,10000,100000", help="comma list of candidate counts")
+    p_conf.add_argument("--repeat", type=int, default=3)
+    p_conf.add_argument(
+        "--pairwise-max",
+        type=int,
+        default=5000,
+        help="also time a naive pairwise compare up to this many candidates",
+    )
+    p_conf.add_argument("--seed", type=int, default=1)
+
+    return p.parse_args(argv)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.cmd == "tokenizer":
+        result = bench_tokenizer(args.statements, args.quoted_ratio, args.repeat, args.seed)
+        print(json.dumps(result, indent=2, ensure_ascii=True))
+        return 0
+    if args.cmd == "conflicts":
+        sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+        result = bench_conflicts(sizes, args.repeat, args.pairwise_max, args.seed)
+        print(json.dumps(result, indent=2, ensure_ascii=True))
+        return 0
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    for fmt in formats:
+        if fmt not in FORMATS:
+            print(f"bench_governance_ingestion: unsupported format: {fmt}", file=sys.stderr)
+            return 2
+    fact_types = [f.strip() for f in args.fact_types.split(",") if f.strip()] or sorted(engine.KNOWN_FACT_TYPES)
+
+    if args.cmd == "generate":
+        args.out_dir.mkdir(parents=True, exist_ok=True)
+        rules = _synthetic_rules(
+            args.statements, fact_types, args.unknown_ratio, args.invalid_ratio, args.quoted_ratio, args.seed
+        )
+        for fmt in formats:
+            dst = args.out_dir / f"synthetic-{args.statements}.{FORMATS[fmt][1]}"
+            dst.write_text(synthetic_sheet(fmt, rules), encoding="utf-8")
+            print(dst)
+        return 0
+    if args.cmd == "pipeline":
+        sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+        result = bench_pipeline(
+            formats,
+            sizes,
+            fact_types,
+            args.unknown_ratio,
+            args.invalid_ratio,
+            args.quoted_ratio,
+            args.repeat,
+            not args.no_validate,
+            args.seed,
+        )
+        text = json.dumps(result, indent=2, ensure_ascii=True)
+        if args.out:
+            args.out.parent.mkdir(parents=True, exist_ok=True)
+            args.out.write_text(text + "\n", encoding="utf-8")
+        else:
+            print(text)
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,22 +2,50 @@
 from __future__ import annotations
 
 import argparse
+import ctypes
+import hashlib
+import importlib
 import json
+import os
 import re
 import shlex
-from dataclasses import dataclass
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import IO, Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Set, Tuple
+
+import governance_ingestion_sidecar as sidecars
 
 ROOT = Path(__file__).resolve().parents[2]
 SCHEMA_DIR = ROOT / "governance" / "grammar" / "schema"
+SPEC_SCHEMA_DIR = ROOT / "spec" / "sch" / "model_schema"
 INGESTION_DIR = ROOT / "governance" / "ingestion"
 
-SOURCE_SCHEMA = SCHEMA_DIR / "enterprise_governance_source.v1.schema.json"
+# Source manifests validate against the spec copy, which lists every
+# source_format the handler registry ships (csv_rule_sheet included).
+SOURCE_SCHEMA = SPEC_SCHEMA_DIR / "manifests" / "enterprise-governance-source.v1.schema.json"
 PARSED_SCHEMA = SCHEMA_DIR / "governance_parsed_facts.v1.schema.json"
 NORMALIZED_SCHEMA = SCHEMA_DIR / "enterprise_governance_normalized.v1.schema.json"
 CANDIDATE_SCHEMA = SCHEMA_DIR / "enterprise_custom_governance.v1.schema.json"
+CACHE_DIR = INGESTION_DIR / "cache"
+PROFILE_DIR = INGESTION_DIR / "profile"
+PROFILE_ENV = "YAI_INGEST_PROFILE"
+SIDECAR_ENV = "YAI_INGEST_SIDECAR"
+FORMATS_ENV = "YAI_INGEST_FORMATS"
+TIMESTAMP_MODES = ("wall", "epoch", "source")
+FSYNC_MODES = ("none", "each", "batch")
+JSON_STYLES = ("pretty", "compact")
+
+# Bump whenever a change alters the bytes a stage produces, so stage cache
+# records written by an older engine stop matching.
+ENGINE_VERSION = "2"
 
 KNOWN_FACT_TYPES = {
     "approval_required",
@@ -36,10 +64,20 @@ KNOWN_FACT_TYPES = {
 }
 
 
+# shlex.split (posix, no comments) splits on these four characters only, so a
+# statement without quotes or backslashes tokenizes identically with a regex.
+_RULE_TOKEN_RE = re.compile(r"[^ \t\r\n]+")
+_SHLEX_SPECIAL_RE = re.compile(r"[\"'\\]")
+
+
 @dataclass(frozen=True)
 class RuleLine:
     statement: str
     statement_ref: str
+    # Structured lines (JSON rule objects) carry fact_type/attributes directly
+    # and leave statement empty; see _structured_rule_line.
+    fact_type: str | None = None
+    attributes: Tuple[Tuple[str, str], ...] | None = None
 
 
 def _read_json(path: Path) -> Any:
@@ -47,11 +85,165 @@ def _read_json(path: Path) -> Any:
         return json.load(f)
 
 
+class _ArtifactWriter:
+    """Atomic artifact writes: temp file next to the destination, then os.replace.
+
+    fsync modes: none (rename only; the previous behaviour's durability),
+    each (fsync file and directory per write), batch (renames happen
+    immediately, one sync pass at flush() covers every write since the last
+    one). style "compact" drops the indent=2 pretty printing. Binary sidecars
+    go through the same writer (open(path, binary=True)).
+    """
+
+    def __init__(self) -> None:
+        self.fsync = "none"
+        self.style = "pretty"
+        self._dirs: Set[Path] = set()
+        self._pending: List[Path] = []
+        self._lock = threading.Lock()
+
+    def configure(self, fsync: str, style: str) -> None:
+        self.fsync = fsync
+        self.style = style
+
+    def dumps(self, value: Any, indent: int = 0) -> str:
+        # Text for value nested `indent` spaces deep, matching what json.dump
+        # would emit for it inside a larger document.
+        if self.style == "compact":
+            return json.dumps(value, separators=(",", ":"), ensure_ascii=True, default=_json_default)
+        text = json.dumps(value, indent=2, ensure_ascii=True, default=_json_default)
+        return text.replace("\n", "\n" + " " * indent) if indent else text
+
+    def _ensure_dir(self, directory: Path) -> None:
+        if directory not in self._dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(directory)
+
+    def _open_tmp(self, tmp: Path, binary: bool) -> IO[Any]:
+        try:
+            return tmp.open("wb") if binary else tmp.open("w", encoding="utf-8")
+        except FileNotFoundError:
+            # The directory was removed after it was cached (e.g. under a
+            # long-running watch); recreate it once.
+            self._dirs.discard(tmp.parent)
+            self._ensure_dir(tmp.parent)
+            return tmp.open("wb") if binary else tmp.open("w", encoding="utf-8")
+
+    @contextmanager
+    def open(self, path: Path, binary: bool = False) -> Iterator[IO[Any]]:
+        self._ensure_dir(path.parent)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with self._open_tmp(tmp, binary) as f:
+                yield f
+                if self.fsync == "each":
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        if self.fsync == "each":
+            _fsync_path(path.parent)
+        elif self.fsync == "batch":
+            with self._lock:
+                self._pending.append(path)
+
+    def write_json(self, path: Path, payload: Any) -> None:
+        with self.open(path) as f:
+            f.write(self.dumps(payload))
+            f.write("\n")
+
+    def take_pending(self) -> List[Path]:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+    def flush(self, extra: Iterable[Path] = ()) -> None:
+        """batch mode: make every write since the last flush durable."""
+        pending = self.take_pending() + list(extra)
+        if self.fsync != "batch" or not pending:
+            return
+        # Writes may span filesystems (--out, other mounts). Each one gets a
+        # syncfs() where the platform has it -- cheaper for a batch than one
+        # fsync per artifact, at the cost of flushing that filesystem's other
+        # dirty pages too -- otherwise fsync of each file, then each directory.
+        by_device: Dict[int, List[Path]] = {}
+        for path in pending:
+            try:
+                by_device.setdefault(path.parent.stat().st_dev, []).append(path)
+            except FileNotFoundError:
+                continue
+        for paths in by_device.values():
+            if _syncfs(paths[0].parent):
+                continue
+            for path in paths + sorted({path.parent for path in paths}):
+                try:
+                    _fsync_path(path)
+                except FileNotFoundError:
+                    continue  # removed since it was written (e.g. run --intermediates skip)
+
+
+def _fsync_path(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _syncfs(path: Path) -> bool:
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        syncfs = libc.syncfs
+    except (OSError, AttributeError):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return syncfs(fd) == 0
+    finally:
+        os.close(fd)
+
+
+_WRITER = _ArtifactWriter()
+
+
 def _write_json(path: Path, payload: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=True)
-        f.write("\n")
+    _WRITER.write_json(path, payload)
+
+
+# Binary sidecars (governance_ingestion_sidecar) next to parsed/normalized
+# artifacts; off unless --sidecars or YAI_INGEST_SIDECAR=1.
+_SIDECARS = {"enabled": False}
+
+
+def _configure_sidecars(enabled: bool | None) -> None:
+    if enabled is None:
+        enabled = os.environ.get(SIDECAR_ENV, "").strip().lower() not in ("", "0", "off", "false", "no")
+    _SIDECARS["enabled"] = enabled
+
+
+def _open_sidecar(path: Path) -> ContextManager[IO[bytes]]:
+    # Sidecars share the artifact writer's atomic rename and fsync mode.
+    return _WRITER.open(path, binary=True)
+
+
+def _write_sidecar(path: Path, doc: Dict[str, Any]) -> None:
+    if _SIDECARS["enabled"]:
+        sidecars.write_sidecar(path, doc, _json_default, _open_sidecar)
+
+
+def _ensure_sidecar(path: Path) -> None:
+    # Cache hits skip the writer, so backfill a missing or stale sidecar.
+    if _SIDECARS["enabled"] and sidecars.read_summary(path) is None:
+        sidecars.write_sidecar(path, _read_json(path), open_dst=_open_sidecar)
+
+
+def _json_default(value: Any) -> Any:
+    # Output boundary for compact in-memory records (see FactRecord).
+    if isinstance(value, FactRecord):
+        return value.to_json()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 def _repo_rel(path: Path) -> str:
@@ -62,8 +254,202 @@ def _repo_rel(path: Path) -> str:
         return str(path)
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+# How generated_at / candidate version are stamped:
+#   wall   - current time (default)
+#   epoch  - SOURCE_DATE_EPOCH (default whenever that variable is set)
+#   source - latest updated_at (else created_at) of the contributing sources
+# epoch and source make unchanged inputs produce byte-identical artifacts.
+_CLOCK = {"mode": "wall"}
+
+
+def _configure_timestamps(mode: str | None) -> None:
+    if mode is None:
+        mode = "epoch" if os.environ.get("SOURCE_DATE_EPOCH", "").strip() else "wall"
+    if mode == "epoch":
+        _source_date_epoch()
+    _CLOCK["mode"] = mode
+
+
+def _source_date_epoch() -> datetime:
+    raw = os.environ.get("SOURCE_DATE_EPOCH", "").strip()
+    if not raw.isdigit():
+        raise ValueError(f"SOURCE_DATE_EPOCH must be a non-negative integer, got {raw!r}")
+    return datetime.fromtimestamp(int(raw), timezone.utc)
+
+
+def _source_time(source: Dict[str, Any]) -> datetime:
+    raw = str(source.get("updated_at") or source.get("created_at") or "").strip()
+    try:
+        stamp = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"{source.get('source_id', '?')}: --timestamps source needs updated_at or created_at") from None
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp.astimezone(timezone.utc)
+
+
+def _build_time(sources: Iterable[Dict[str, Any]]) -> datetime:
+    mode = _CLOCK["mode"]
+    if mode == "epoch":
+        return _source_date_epoch()
+    if mode == "source":
+        return max(_source_time(source) for source in sources)
+    return datetime.now(timezone.utc)
+
+
+def _stamp_iso(*sources: Dict[str, Any]) -> str:
+    return _build_time(sources).replace(microsecond=0).isoformat()
+
+
+def _clock_key() -> str:
+    # Part of every stage key: a cached artifact is only reused when it was
+    # stamped the same way.
+    mode = _CLOCK["mode"]
+    if mode == "epoch":
+        return f"epoch:{os.environ.get('SOURCE_DATE_EPOCH', '').strip()}"
+    return mode
+
+
+class _Profiler:
+    """Opt-in per-stage trace records (wall/CPU time, item counts, allocations).
+
+    Disabled unless configured from --profile or YAI_INGEST_PROFILE; "alloc"
+    additionally tracks allocations through tracemalloc, which is much slower.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.alloc = False
+        self.records: List[Dict[str, Any]] = []
+
+    def configure(self, mode: str | None) -> None:
+        value = (mode if mode is not None else os.environ.get(PROFILE_ENV, "")).strip().lower()
+        self.enabled = value not in ("", "0", "off", "false", "no")
+        self.alloc = value == "alloc"
+        if self.alloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @property
+    def mode(self) -> str:
+        if not self.enabled:
+            return "off"
+        return "alloc" if self.alloc else "timing"
+
+    @contextmanager
+    def stage(self, stage: str, source_id: str) -> Iterator[Dict[str, Any]]:
+        record: Dict[str, Any] = {
+            "kind": "governance_ingestion_trace",
+            "schema_version": "v1",
+            "pid": os.getpid(),
+            "source_id": source_id,
+            "stage": stage,
+            "cached": False,
+            "counts": {},
+            "substages": {},
+        }
+        if not self.enabled:
+            yield record
+            return
+        if self.alloc:
+            tracemalloc.reset_peak()
+            alloc_start = tracemalloc.get_traced_memory()[0]
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_s"] = round(time.perf_counter() - wall, 6)
+            record["cpu_s"] = round(time.process_time() - cpu, 6)
+            if self.alloc:
+                current, peak = tracemalloc.get_traced_memory()
+                record["alloc_net_bytes"] = current - alloc_start
+                record["alloc_peak_bytes"] = peak - alloc_start
+            self.records.append(record)
+
+    def cached(self, stage: str, source_id: str) -> None:
+        if self.enabled:
+            with self.stage(stage, source_id) as record:
+                record["cached"] = True
+
+    def drain(self) -> List[Dict[str, Any]]:
+        records, self.records = self.records, []
+        return records
+
+    def flush(self, path: Path | None) -> Path | None:
+        if not self.enabled or not self.records:
+            return None
+        dst = path or PROFILE_DIR / "ingest-trace.v1.ndjson"
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        with dst.open("a", encoding="utf-8") as f:
+            for record in self.drain():
+                f.write(json.dumps(record, sort_keys=True, ensure_ascii=True))
+                f.write("\n")
+        return dst
+
+
+_PROFILER = _Profiler()
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+_CACHE_STATS: Dict[str, int] = {"hit": 0, "miss": 0}
+
+
+def _stage_key(stage: str, inputs: List[Path], dst: Path) -> str:
+    h = hashlib.sha256()
+    h.update(f"{stage}\0{ENGINE_VERSION}\0{_clock_key()}\0{_WRITER.style}\0{_repo_rel(dst)}\0".encode("utf-8"))
+    h.update("\0".join(sorted(KNOWN_FACT_TYPES)).encode("utf-8"))
+    for p in inputs:
+        h.update(f"\0{_repo_rel(p)}\0{_file_sha256(p)}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _stage_cache_path(source: Dict[str, Any], stage: str) -> Path:
+    return CACHE_DIR / f"{_source_id(source)}.{stage}.v1.json"
+
+
+def _stage_cache_hit(source: Dict[str, Any], stage: str, key: str, dst: Path) -> bool:
+    record_path = _stage_cache_path(source, stage)
+    hit = False
+    if record_path.exists() and dst.exists():
+        try:
+            record = _read_json(record_path)
+        except Exception:
+            record = {}
+        st = dst.stat()
+        hit = (
+            record.get("key") == key
+            and record.get("artifact") == _repo_rel(dst)
+            and record.get("artifact_size") == st.st_size
+            and record.get("artifact_mtime_ns") == st.st_mtime_ns
+        )
+    _CACHE_STATS["hit" if hit else "miss"] += 1
+    if hit:
+        _PROFILER.cached(stage, _source_id(source))
+    return hit
+
+
+def _stage_cache_store(source: Dict[str, Any], stage: str, key: str, dst: Path) -> None:
+    st = dst.stat()
+    _write_json(
+        _stage_cache_path(source, stage),
+        {
+            "kind": "governance_ingestion_stage_cache",
+            "schema_version": "v1",
+            "stage": stage,
+            "engine_version": ENGINE_VERSION,
+            "key": key,
+            "artifact": _repo_rel(dst),
+            "artifact_size": st.st_size,
+            "artifact_mtime_ns": st.st_mtime_ns,
+        },
+    )
 
 
 def _load_source(source_path: Path) -> Dict[str, Any]:
@@ -94,11 +480,16 @@ def _payload_path(source: Dict[str, Any]) -> Path:
     return payload
 
 
-def _rule_lines_from_markdown(path: Path) -> List[RuleLine]:
-    lines: List[RuleLine] = []
+def _text_lines(path: Path) -> Iterator[str]:
+    # Same line split as read_text().splitlines(), without holding the file in memory.
+    with path.open("r", encoding="utf-8") as f:
+        for chunk in f:
+            yield from chunk.splitlines()
+
+
+def _rule_lines_from_markdown(path: Path) -> Iterator[RuleLine]:
     rel = _repo_rel(path)
-    text = path.read_text(encoding="utf-8").splitlines()
-    for i, raw in enumerate(text, start=1):
+    for i, raw in enumerate(_text_lines(path), start=1):
         line = raw.strip()
         if not line:
             continue
@@ -107,26 +498,22 @@ def _rule_lines_from_markdown(path: Path) -> List[RuleLine]:
         if line.startswith("* "):
             line = line[2:].strip()
         if line.startswith("RULE "):
-            lines.append(RuleLine(statement=line, statement_ref=f"{rel}:{i}"))
-    return lines
+            yield RuleLine(statement=line, statement_ref=f"{rel}:{i}")
 
 
-def _rule_lines_from_yaml_rule_sheet(path: Path) -> List[RuleLine]:
+def _rule_lines_from_yaml_rule_sheet(path: Path) -> Iterator[RuleLine]:
     # Deterministic restricted mode: we only consume explicit RULE lines.
-    lines: List[RuleLine] = []
     rel = _repo_rel(path)
-    for i, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+    for i, raw in enumerate(_text_lines(path), start=1):
         line = raw.strip()
         if line.startswith("- "):
             line = line[2:].strip()
         if line.startswith("RULE "):
-            lines.append(RuleLine(statement=line, statement_ref=f"{rel}:{i}"))
-    return lines
+            yield RuleLine(statement=line, statement_ref=f"{rel}:{i}")
 
 
-def _rule_lines_from_json_rule_sheet(path: Path) -> List[RuleLine]:
+def _rule_lines_from_json_rule_sheet(path: Path) -> Iterator[RuleLine]:
     payload = _read_json(path)
-    lines: List[RuleLine] = []
     rel = _repo_rel(path)
     rules = payload.get("rules", [])
     for idx, rule in enumerate(rules):
@@ -134,13 +521,13 @@ def _rule_lines_from_json_rule_sheet(path: Path) -> List[RuleLine]:
         if isinstance(rule, str):
             statement = rule.strip()
             if statement.startswith("RULE "):
-                lines.append(RuleLine(statement=statement, statement_ref=ref))
+                yield RuleLine(statement=statement, statement_ref=ref)
             continue
         if isinstance(rule, dict):
             fact_type = str(rule.get("fact_type", "")).strip()
             if not fact_type:
                 continue
-            tokens = [f"RULE {fact_type}"]
+            pairs: List[Tuple[str, str]] = []
             for key in sorted(rule.keys()):
                 if key == "fact_type":
                     continue
@@ -149,18 +536,43 @@ def _rule_lines_from_json_rule_sheet(path: Path) -> List[RuleLine]:
                     sval = "true" if val else "false"
                 else:
                     sval = str(val)
-                tokens.append(f"{key}={sval}")
-            lines.append(RuleLine(statement=" ".join(tokens), statement_ref=ref))
+                pairs.append((key, sval))
+            yield _structured_rule_line(fact_type, pairs, ref)
     for idx, stmt in enumerate(payload.get("statements", [])):
         ref = f"{rel}#statements[{idx}]"
         if isinstance(stmt, str) and stmt.strip().startswith("RULE "):
-            lines.append(RuleLine(statement=stmt.strip(), statement_ref=ref))
-    return lines
+            yield RuleLine(statement=stmt.strip(), statement_ref=ref)
+
+
+def _is_plain_token(text: str) -> bool:
+    return _RULE_TOKEN_RE.fullmatch(text) is not None and _SHLEX_SPECIAL_RE.search(text) is None
+
+
+def _structured_rule_line(fact_type: str, pairs: List[Tuple[str, str]], ref: str) -> RuleLine:
+    # When every piece would survive tokenization as a single key=value token,
+    # skip rendering "RULE fact_type k=v ..." just to split it again. Anything
+    # else goes through the statement path so quoting and invalid-token
+    # handling stay exactly as before.
+    if _is_plain_token(fact_type) and all(
+        _is_plain_token(k) and "=" not in k and (v == "" or _is_plain_token(v)) for k, v in pairs
+    ):
+        return RuleLine(statement="", statement_ref=ref, fact_type=fact_type, attributes=tuple(pairs))
+    tokens = [f"RULE {fact_type}"]
+    tokens.extend(f"{k}={v}" for k, v in pairs)
+    return RuleLine(statement=" ".join(tokens), statement_ref=ref)
+
+
+def _tokenize_rule_statement(statement: str) -> List[str]:
+    if _SHLEX_SPECIAL_RE.search(statement) is None:
+        return _RULE_TOKEN_RE.findall(statement)
+    return shlex.split(statement)
 
 
 def _parse_rule_statement(rule_line: RuleLine) -> Tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
+    if rule_line.attributes is not None:
+        return _parse_structured_rule(rule_line), None
     try:
-        tokens = shlex.split(rule_line.statement)
+        tokens = _tokenize_rule_statement(rule_line.statement)
     except Exception as exc:
         return None, {"statement_ref": rule_line.statement_ref, "error": f"tokenization_error: {exc}"}
     if len(tokens) < 2 or tokens[0] != "RULE":
@@ -191,15 +603,73 @@ def _parse_rule_statement(rule_line: RuleLine) -> Tuple[Dict[str, Any] | None, D
     return parsed, None
 
 
-def _collect_rule_lines(source: Dict[str, Any], payload: Path) -> List[RuleLine]:
-    source_format = source.get("source_format")
-    if source_format == "markdown_rule_sheet":
-        return _rule_lines_from_markdown(payload)
-    if source_format == "yaml_rule_sheet":
-        return _rule_lines_from_yaml_rule_sheet(payload)
-    if source_format == "json_rule_sheet":
-        return _rule_lines_from_json_rule_sheet(payload)
-    raise ValueError(f"unsupported source_format: {source_format}")
+def _parse_structured_rule(rule_line: RuleLine) -> Dict[str, Any]:
+    attrs: Dict[str, str] = {}
+    invalid_tokens: List[str] = []
+    for key, value in rule_line.attributes or ():
+        k = key.strip()
+        if not k:
+            invalid_tokens.append(f"{key}={value}")
+            continue
+        attrs[k] = value.strip()
+    return {
+        "fact_type": str(rule_line.fact_type),
+        "attributes": attrs,
+        "raw_statement": rule_line.statement,
+        "raw_statement_ref": rule_line.statement_ref,
+        "invalid_tokens": invalid_tokens,
+    }
+
+
+# source_format -> handler(path) yielding RuleLine. A "module:function" entry is
+# imported on first use (from tools/gen or anywhere on sys.path) and called as
+# function(path, rel, RuleLine, _structured_rule_line), so format modules need
+# not import the engine. More entries can be added without touching this file
+# via YAI_INGEST_FORMATS="fmt=module:function,...".
+_FORMAT_HANDLERS: Dict[str, Any] = {
+    "markdown_rule_sheet": _rule_lines_from_markdown,
+    "yaml_rule_sheet": _rule_lines_from_yaml_rule_sheet,
+    "json_rule_sheet": _rule_lines_from_json_rule_sheet,
+    "csv_rule_sheet": "governance_ingestion_csv:rule_lines",
+}
+_FORMATS_FROM_ENV: Set[str] = set()
+
+
+def _register_formats_from_env() -> None:
+    raw = os.environ.get(FORMATS_ENV, "")
+    if raw in _FORMATS_FROM_ENV:
+        return
+    _FORMATS_FROM_ENV.add(raw)
+    for entry in raw.split(","):
+        name, sep, target = entry.strip().partition("=")
+        if not entry.strip():
+            continue
+        if not sep or ":" not in target:
+            raise ValueError(f"{FORMATS_ENV}: expected format=module:function, got {entry.strip()!r}")
+        _FORMAT_HANDLERS[name.strip()] = target.strip()
+
+
+def _format_handler(source_format: Any) -> Callable[[Path], Iterator[RuleLine]]:
+    _register_formats_from_env()
+    handler = _FORMAT_HANDLERS.get(str(source_format)) if source_format is not None else None
+    if handler is None:
+        raise ValueError(f"unsupported source_format: {source_format}")
+    if isinstance(handler, str):
+        module_name, _, func_name = handler.partition(":")
+        try:
+            func = getattr(importlib.import_module(module_name), func_name)
+        except (ImportError, AttributeError) as exc:
+            raise ValueError(f"source_format {source_format}: cannot load handler {handler}: {exc}") from exc
+
+        def bound(path: Path, func: Any = func) -> Iterator[RuleLine]:
+            return func(path, _repo_rel(path), RuleLine, _structured_rule_line)
+
+        handler = _FORMAT_HANDLERS[str(source_format)] = bound
+    return handler
+
+
+def _collect_rule_lines(source: Dict[str, Any], payload: Path) -> Iterator[RuleLine]:
+    return _format_handler(source.get("source_format"))(payload)
 
 
 def _parsed_path(source: Dict[str, Any], out: Path | None) -> Path:
@@ -222,22 +692,174 @@ def _candidate_path_from_source(source: Dict[str, Any], out: Path | None) -> Pat
     return INGESTION_DIR / "candidates" / f"enterprise.{org}.{sid}.candidate.v1.json"
 
 
-def _parse(source_path: Path, out: Path | None) -> Path:
-    source = _load_source(source_path)
-    payload = _payload_path(source)
-    rule_lines = _collect_rule_lines(source, payload)
+@dataclass
+class _ParseState:
+    total_statements: int = 0
+    parsed_count: int = 0
+    unknown_count: int = 0
+    unresolved: List[Dict[str, Any]] = field(default_factory=list)
+    invalid: List[Dict[str, Any]] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    tokenize_wall_s: float = 0.0
+    tokenize_cpu_s: float = 0.0
+
+
+def _record_parse_state(record: Dict[str, Any], state: _ParseState) -> None:
+    record["counts"].update(
+        {
+            "statements": state.total_statements,
+            "facts": state.parsed_count,
+            "unknown_fact_types": state.unknown_count,
+            "invalid_statements": len(state.invalid),
+            "warnings": len(state.warnings),
+        }
+    )
+    if _PROFILER.enabled:
+        record["substages"]["tokenize"] = {
+            "wall_s": round(state.tokenize_wall_s, 6),
+            "cpu_s": round(state.tokenize_cpu_s, 6),
+        }
 
-    facts: List[Dict[str, Any]] = []
-    unresolved: List[Dict[str, Any]] = []
-    invalid: List[Dict[str, Any]] = []
-    warnings: List[str] = []
 
-    parsed_count = 0
-    unknown_count = 0
+# Attribute-key tuples shared between records with the same key layout.
+_ATTR_KEY_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+# Short attribute values (modes, severities, targets) repeat across facts and
+# are interned too; long free text is kept as-is.
+_INTERN_VALUE_MAX = 64
+
+
+class FactRecord:
+    """Compact in-memory parsed fact.
+
+    Holds the same data as a governance_parsed_facts v1 fact dict with slots
+    instead of a per-fact dict: fact_type, source_ref, attribute keys and short
+    attribute values are interned, attribute keys are a shared tuple, and
+    fact_id/notes are derived on demand. get() mirrors dict.get for the fields the normalizer reads;
+    to_json() rebuilds the exact v1 dict at the output boundary.
+    """
+
+    __slots__ = (
+        "fact_no",
+        "fact_type",
+        "source_ref",
+        "confidence",
+        "raw_statement_ref",
+        "status",
+        "attr_keys",
+        "attr_values",
+        "scope_hint",
+        "target_hint",
+    )
+
+    def __init__(
+        self,
+        fact_no: int,
+        fact_type: str,
+        source_ref: str,
+        confidence: float,
+        raw_statement_ref: str,
+        status: str,
+        attributes: Dict[str, str],
+        scope_hint: str | None = None,
+        target_hint: str | None = None,
+    ) -> None:
+        keys = tuple(sys.intern(k) for k in attributes)
+        self.fact_no = fact_no
+        self.fact_type = sys.intern(fact_type)
+        self.source_ref = sys.intern(source_ref)
+        self.confidence = confidence
+        self.raw_statement_ref = raw_statement_ref
+        self.status = sys.intern(status)
+        self.attr_keys = _ATTR_KEY_TUPLES.setdefault(keys, keys)
+        self.attr_values = tuple(sys.intern(v) if len(v) <= _INTERN_VALUE_MAX else v for v in attributes.values())
+        self.scope_hint = sys.intern(scope_hint) if isinstance(scope_hint, str) else scope_hint
+        self.target_hint = sys.intern(target_hint) if isinstance(target_hint, str) else target_hint
+
+    @classmethod
+    def from_json(cls, fact: Dict[str, Any]) -> "FactRecord":
+        fact_id = str(fact.get("fact_id", ""))
+        try:
+            record = cls(
+                int(fact_id[5:]) if fact_id.startswith("fact-") else -1,
+                fact["fact_type"],
+                fact["source_ref"],
+                fact["confidence"],
+                fact["raw_statement_ref"],
+                fact["status"],
+                dict(fact["attributes"]),
+                fact.get("scope_hint"),
+                fact.get("target_hint"),
+            )
+        except (KeyError, TypeError, ValueError):
+            record = None
+        if record is None or record.to_json() != fact:
+            raise ValueError(f"fact {fact_id or '?'} has no compact form")
+        return record
+
+    @property
+    def fact_id(self) -> str:
+        return f"fact-{self.fact_no:04d}"
+
+    @property
+    def attributes(self) -> Dict[str, str]:
+        return dict(zip(self.attr_keys, self.attr_values))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in ("fact_id", "attributes"):
+            return getattr(self, key)
+        if key == "notes":
+            return self.attributes.get("rationale", "")
+        if key in self.__slots__:
+            value = getattr(self, key)
+            return default if value is None else value
+        return default
+
+    def to_json(self) -> Dict[str, Any]:
+        attrs = self.attributes
+        fact: Dict[str, Any] = {
+            "fact_id": self.fact_id,
+            "fact_type": self.fact_type,
+            "source_ref": self.source_ref,
+            "confidence": self.confidence,
+            "raw_statement_ref": self.raw_statement_ref,
+            "status": self.status,
+            "attributes": attrs,
+            "notes": attrs.get("rationale", ""),
+        }
+        if self.scope_hint is not None:
+            fact["scope_hint"] = self.scope_hint
+        if self.target_hint is not None:
+            fact["target_hint"] = self.target_hint
+        return fact
+
+
+def _compact_facts(parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """parsed doc with its fact dicts swapped for FactRecords (where they round-trip)."""
+    facts: List[Any] = []
+    for fact in parsed.get("facts", []):
+        try:
+            facts.append(FactRecord.from_json(fact))
+        except ValueError:
+            facts.append(fact)
+    return {**parsed, "facts": facts}
+
+
+def _iter_fact_records(
+    source: Dict[str, Any], rule_lines: Iterable[RuleLine], state: _ParseState
+) -> Iterator[FactRecord]:
+    profiling = _PROFILER.enabled
     for idx, rule_line in enumerate(rule_lines, start=1):
-        parsed_stmt, parse_error = _parse_rule_statement(rule_line)
+        state.total_statements = idx
+        if profiling:
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            parsed_stmt, parse_error = _parse_rule_statement(rule_line)
+            state.tokenize_wall_s += time.perf_counter() - wall
+            state.tokenize_cpu_s += time.process_time() - cpu
+        else:
+            parsed_stmt, parse_error = _parse_rule_statement(rule_line)
         if parse_error is not None:
-            invalid.append(parse_error)
+            state.invalid.append(parse_error)
             continue
         assert parsed_stmt is not None
         fact_type = str(parsed_stmt["fact_type"])
@@ -247,8 +869,8 @@ def _parse(source_path: Path, out: Path | None) -> Path:
         status = "parsed"
         if fact_type not in KNOWN_FACT_TYPES:
             status = "unresolved"
-            unknown_count += 1
-            unresolved.append(
+            state.unknown_count += 1
+            state.unresolved.append(
                 {
                     "statement_ref": parsed_stmt["raw_statement_ref"],
                     "reason": "unknown_fact_type",
@@ -257,155 +879,393 @@ def _parse(source_path: Path, out: Path | None) -> Path:
             )
 
         if invalid_tokens:
-            warnings.append(
+            state.warnings.append(
                 f"{parsed_stmt['raw_statement_ref']}: ignored invalid tokens: {', '.join(invalid_tokens)}"
             )
 
-        parsed_count += 1
-        fact = {
-            "fact_id": f"fact-{idx:04d}",
-            "fact_type": fact_type,
-            "source_ref": source["source_id"],
-            "confidence": float(source.get("confidence_hint", 1.0)),
-            "raw_statement_ref": parsed_stmt["raw_statement_ref"],
-            "status": status,
-            "attributes": attrs,
-            "notes": attrs.get("rationale", ""),
-        }
+        state.parsed_count += 1
         scope_hint = attrs.get("scope") or (source.get("domain_targets") or [None])[0]
         target_hint = attrs.get("target") or attrs.get("sink") or attrs.get("workspace")
-        if isinstance(scope_hint, str) and scope_hint:
-            fact["scope_hint"] = scope_hint
-        if isinstance(target_hint, str) and target_hint:
-            fact["target_hint"] = target_hint
-        facts.append(fact)
+        yield FactRecord(
+            idx,
+            fact_type,
+            source["source_id"],
+            float(source.get("confidence_hint", 1.0)),
+            parsed_stmt["raw_statement_ref"],
+            status,
+            attrs,
+            scope_hint if isinstance(scope_hint, str) and scope_hint else None,
+            target_hint if isinstance(target_hint, str) and target_hint else None,
+        )
+
 
+def _iter_facts(source: Dict[str, Any], rule_lines: Iterable[RuleLine], state: _ParseState) -> Iterator[Dict[str, Any]]:
+    for record in _iter_fact_records(source, rule_lines, state):
+        yield record.to_json()
+
+
+def _parsed_tail(source: Dict[str, Any], state: _ParseState) -> Dict[str, Any]:
     coverage = {
         "source_format": source.get("source_format"),
-        "total_statements": len(rule_lines),
-        "parsed_statements": parsed_count,
-        "recognized_fact_types": parsed_count - unknown_count,
-        "unknown_fact_types": unknown_count,
-        "invalid_statements": len(invalid),
+        "total_statements": state.total_statements,
+        "parsed_statements": state.parsed_count,
+        "recognized_fact_types": state.parsed_count - state.unknown_count,
+        "unknown_fact_types": state.unknown_count,
+        "invalid_statements": len(state.invalid),
+    }
+    return {
+        "unresolved_items": state.unresolved,
+        "invalid_items": state.invalid,
+        "source_warnings": state.warnings,
+        "coverage_summary": coverage,
     }
 
-    parsed_payload = {
+
+def _parsed_head(source: Dict[str, Any]) -> Dict[str, Any]:
+    return {
         "kind": "governance_parsed_facts",
         "schema_version": "v1",
         "source_ref": source["source_id"],
-        "generated_at": _now_iso(),
-        "facts": facts,
-        "unresolved_items": unresolved,
-        "invalid_items": invalid,
-        "source_warnings": warnings,
-        "coverage_summary": coverage,
+        "generated_at": _stamp_iso(source),
     }
 
+
+def _write_parsed_facts(
+    path: Path,
+    head: Dict[str, Any],
+    facts: Iterable[Dict[str, Any]],
+    tail: Callable[[], Dict[str, Any]],
+) -> None:
+    # Emits exactly what _write_json would for head + {"facts": [...]} + tail(),
+    # one fact at a time; tail() is evaluated only after the facts are drained.
+    dumps = _WRITER.dumps
+    if _WRITER.style == "compact":
+        nl, nl_item, nl_close, colon = "", "", "", ":"
+    else:
+        nl, nl_item, nl_close, colon = "\n  ", "\n    ", "\n  ", ": "
+    with _WRITER.open(path) as f:
+        f.write("{")
+        for key, value in head.items():
+            f.write(f"{nl}{json.dumps(key)}{colon}{dumps(value, 2)},")
+        f.write(f'{nl}"facts"{colon}[')
+        empty = True
+        for fact in facts:
+            f.write(nl_item if empty else f",{nl_item}")
+            f.write(dumps(fact, 4))
+            empty = False
+        f.write("]" if empty else f"{nl_close}]")
+        for key, value in tail().items():
+            f.write(f",{nl}{json.dumps(key)}{colon}{dumps(value, 2)}")
+        f.write("\n}\n" if nl else "}\n")
+
+
+def _parse(source_path: Path, out: Path | None, force: bool = False) -> Path:
+    source = _load_source(source_path)
+    payload = _payload_path(source)
     dst = _parsed_path(source, out)
-    _write_json(dst, parsed_payload)
+    key = _stage_key("parse", [source_path, payload], dst)
+    if not force and _stage_cache_hit(source, "parse", key, dst):
+        _ensure_sidecar(dst)
+        return dst
+
+    state = _ParseState()
+    with _PROFILER.stage("parse", _source_id(source)) as record:
+        head = _parsed_head(source)
+        facts: Iterable[Dict[str, Any]] = _iter_facts(source, _collect_rule_lines(source, payload), state)
+        writer = None
+        if _SIDECARS["enabled"]:
+            # The sidecar counts facts as they stream past.
+            writer = sidecars.SidecarWriter("governance_parsed_facts")
+            for k, v in head.items():
+                writer.add(k, v)
+            facts = writer.tee_list("facts", facts)
+
+        def tail() -> Dict[str, Any]:
+            doc_tail = _parsed_tail(source, state)
+            if writer is not None:
+                for k, v in doc_tail.items():
+                    writer.add(k, v)
+            return doc_tail
+
+        _write_parsed_facts(dst, head, facts, tail)
+        if writer is not None:
+            writer.finish(dst, _open_sidecar)
+        _record_parse_state(record, state)
+    _stage_cache_store(source, "parse", key, dst)
     return dst
 
 
-def _normalize(source_path: Path, parsed_path: Path | None, out: Path | None) -> Path:
+def _parsed_doc(source: Dict[str, Any], payload: Path, compact: bool = False) -> Dict[str, Any]:
+    """Parsed doc in memory; compact keeps facts as FactRecords until written."""
+    state = _ParseState()
+    with _PROFILER.stage("parse", _source_id(source)) as record:
+        rule_lines = _collect_rule_lines(source, payload)
+        if compact:
+            facts: List[Any] = list(_iter_fact_records(source, rule_lines, state))
+        else:
+            facts = list(_iter_facts(source, rule_lines, state))
+        _record_parse_state(record, state)
+    return {**_parsed_head(source), "facts": facts, **_parsed_tail(source, state)}
+
+
+def _normalize(source_path: Path, parsed_path: Path | None, out: Path | None, force: bool = False) -> Path:
     source = _load_source(source_path)
     parsed_doc_path = parsed_path or _parsed_path(source, None)
-    parsed = _read_json(parsed_doc_path)
+    dst = _normalized_path(source, out)
+    key = _stage_key("normalize", [source_path, parsed_doc_path], dst)
+    if not force and _stage_cache_hit(source, "normalize", key, dst):
+        _ensure_sidecar(dst)
+        return dst
+    normalized = _profiled_normalize(source, _read_json(parsed_doc_path))
+    _write_json(dst, normalized)
+    _write_sidecar(dst, normalized)
+    _stage_cache_store(source, "normalize", key, dst)
+    return dst
 
-    facts = list(parsed.get("facts", []))
-    rule_candidates: List[Dict[str, Any]] = []
-    authority_candidates: List[Dict[str, Any]] = []
-    evidence_candidates: List[Dict[str, Any]] = []
-    precedence_candidates: List[Dict[str, Any]] = []
-    exception_candidates: List[Dict[str, Any]] = []
-    unresolved_ambiguities: List[Dict[str, Any]] = list(parsed.get("unresolved_items", []))
-    conflict_hints: List[Dict[str, Any]] = []
 
-    publication_modes: set[str] = set()
-    distribution_modes: set[str] = set()
+def _record_handler_counts(record: Dict[str, Any], state: _NormalizeState) -> None:
+    record["counts"].update({f"handler.{name}": n for name, n in sorted(state.handler_counts.items())})
 
-    for fact in facts:
-        fact_id = str(fact.get("fact_id", ""))
+
+def _profiled_normalize(source: Dict[str, Any], parsed: Dict[str, Any]) -> Dict[str, Any]:
+    with _PROFILER.stage("normalize", _source_id(source)) as record:
+        state = _NormalizeState()
+        normalized = _normalized_doc(source, parsed, state)
+        _record_handler_counts(record, state)
+        record["counts"].update(
+            {
+                "facts": len(parsed.get("facts", [])),
+                "rule_candidates": len(normalized["rule_candidates"]),
+                "conflict_hints": len(normalized["conflict_hints"]),
+                "unresolved_ambiguities": len(normalized["unresolved_ambiguities"]),
+            }
+        )
+    return normalized
+
+
+# Conflict hints derived from the conflict index: (fact type, hint type, label).
+# Organization-wide: any two modes for the fact type conflict.
+_MODE_CONFLICTS: Tuple[Tuple[str, str, str], ...] = (
+    ("publication_restriction", "publication_mode_conflict", "publication"),
+    ("distribution_restriction", "distribution_mode_conflict", "distribution"),
+)
+# Per (target, scope): two modes for the same target conflict.
+_TARGET_MODE_CONFLICTS: Tuple[Tuple[str, str, str], ...] = (
+    ("sink_restricted", "sink_mode_conflict", "sink restriction"),
+    ("outbound_restriction", "outbound_mode_conflict", "outbound restriction"),
+)
+# Restrictions whose "deny" mode contradicts an approval_required on the same target.
+_DENY_FACT_TYPES = ("sink_restricted", "outbound_restriction")
+_CONFLICT_FACT_TYPES = frozenset(
+    [ft for ft, _, _ in _MODE_CONFLICTS + _TARGET_MODE_CONFLICTS] + ["approval_required"]
+)
+
+
+@dataclass
+class _NormalizeState:
+    fact_refs: List[str] = field(default_factory=list)
+    rule_candidates: List[Dict[str, Any]] = field(default_factory=list)
+    authority_candidates: List[Dict[str, Any]] = field(default_factory=list)
+    evidence_candidates: List[Dict[str, Any]] = field(default_factory=list)
+    precedence_candidates: List[Dict[str, Any]] = field(default_factory=list)
+    exception_candidates: List[Dict[str, Any]] = field(default_factory=list)
+    unresolved_ambiguities: List[Dict[str, Any]] = field(default_factory=list)
+    # fact_type -> (target, scope) -> mode -> fact refs. Filled in the same pass
+    # that builds the candidates, so conflict hints never compare facts pairwise.
+    conflict_index: Dict[str, Dict[Tuple[str, str], Dict[str, List[str]]]] = field(default_factory=dict)
+    # handler name -> facts it processed (profiling only; not part of the output).
+    handler_counts: Dict[str, int] = field(default_factory=dict)
+
+
+# Per-fact handlers: (state, fact_id, fact_type, attrs, fact). Every resolved
+# fact becomes a rule candidate; _FACT_HANDLERS adds the type-specific
+# candidates. Handlers for one type run in tuple order, and each appends to
+# its own candidate list, so output order matches a single pass over facts.
+_FactHandler = Callable[["_NormalizeState", str, str, Dict[str, Any], Any], None]
+
+
+def _handle_rule(state: _NormalizeState, fact_id: str, fact_type: str, attrs: Dict[str, Any], fact: Any) -> None:
+    state.rule_candidates.append(
+        {
+            "source_fact_ref": fact_id,
+            "fact_type": fact_type,
+            "action": attrs.get("action"),
+            "target": attrs.get("target") or attrs.get("sink"),
+            "mode": attrs.get("mode"),
+            "severity": attrs.get("severity"),
+        }
+    )
+
+
+def _handle_conflict_index(
+    state: _NormalizeState, fact_id: str, fact_type: str, attrs: Dict[str, Any], fact: Any
+) -> None:
+    target = attrs.get("target") or attrs.get("sink")
+    scope = attrs.get("scope") or fact.get("scope_hint") or ""
+    by_key = state.conflict_index.setdefault(fact_type, {})
+    by_mode = by_key.setdefault((str(target or ""), str(scope)), {})
+    by_mode.setdefault(str(attrs.get("mode") or ""), []).append(fact_id)
+
+
+def _handle_authority(state: _NormalizeState, fact_id: str, fact_type: str, attrs: Dict[str, Any], fact: Any) -> None:
+    state.authority_candidates.append(
+        {
+            "source_fact_ref": fact_id,
+            "role": attrs.get("role", "unknown"),
+            "reason": "escalated_authority",
+        }
+    )
+
+
+def _handle_evidence(state: _NormalizeState, fact_id: str, fact_type: str, attrs: Dict[str, Any], fact: Any) -> None:
+    evidence = attrs.get("evidence")
+    if evidence:
+        state.evidence_candidates.append({"source_fact_ref": fact_id, "evidence": evidence, "required": True})
+
+
+def _handle_precedence(state: _NormalizeState, fact_id: str, fact_type: str, attrs: Dict[str, Any], fact: Any) -> None:
+    state.precedence_candidates.append(
+        {
+            "source_fact_ref": fact_id,
+            "mode": "specialization+overlays+enterprise-object",
+            "reason": "approval_required",
+        }
+    )
+
+
+def _handle_exception(state: _NormalizeState, fact_id: str, fact_type: str, attrs: Dict[str, Any], fact: Any) -> None:
+    state.exception_candidates.append(
+        {
+            "source_fact_ref": fact_id,
+            "request_type": attrs.get("type", "unspecified"),
+            "scope": attrs.get("scope", "workspace"),
+        }
+    )
+
+
+def _fact_handler_table() -> Dict[str, Tuple[_FactHandler, ...]]:
+    table: Dict[str, List[_FactHandler]] = {}
+
+    def register(fact_types: Iterable[str], handler: _FactHandler) -> None:
+        for fact_type in fact_types:
+            table.setdefault(fact_type, []).append(handler)
+
+    register(sorted(_CONFLICT_FACT_TYPES), _handle_conflict_index)
+    register(["authority_escalation"], _handle_authority)
+    register(["evidence_required", "approval_required"], _handle_evidence)
+    register(["approval_required"], _handle_precedence)
+    register(["exception_request"], _handle_exception)
+    return {fact_type: tuple(handlers) for fact_type, handlers in table.items()}
+
+
+_FACT_HANDLERS: Dict[str, Tuple[_FactHandler, ...]] = _fact_handler_table()
+
+
+def _handler_name(handler: _FactHandler) -> str:
+    return handler.__name__[len("_handle_") :]
+
+
+def _normalize_facts(state: _NormalizeState, parsed: Dict[str, Any], ref_prefix: str = "") -> None:
+    """Fold one parsed document into state; ref_prefix qualifies fact ids when merging."""
+    state.unresolved_ambiguities.extend(parsed.get("unresolved_items", []))
+    counts = state.handler_counts
+    for fact in parsed.get("facts", []):
+        raw_id = fact.get("fact_id", "")
+        if raw_id:
+            state.fact_refs.append(f"{ref_prefix}{raw_id}")
+        fact_id = f"{ref_prefix}{raw_id}"
         fact_type = str(fact.get("fact_type", ""))
-        attrs = dict(fact.get("attributes", {}))
         if fact.get("status") == "unresolved":
-            unresolved_ambiguities.append(
+            state.unresolved_ambiguities.append(
                 {
                     "source_fact_ref": fact_id,
                     "reason": "fact_unresolved",
                     "fact_type": fact_type,
                 }
             )
+            counts["unresolved"] = counts.get("unresolved", 0) + 1
             continue
 
-        rule_candidates.append(
-            {
-                "source_fact_ref": fact_id,
-                "fact_type": fact_type,
-                "action": attrs.get("action"),
-                "target": attrs.get("target") or attrs.get("sink"),
-                "mode": attrs.get("mode"),
-                "severity": attrs.get("severity"),
-            }
-        )
-
-        if fact_type == "authority_escalation":
-            authority_candidates.append(
+        attrs = dict(fact.get("attributes", {}))
+        _handle_rule(state, fact_id, fact_type, attrs, fact)
+        counts["rule"] = counts.get("rule", 0) + 1
+        for handler in _FACT_HANDLERS.get(fact_type, ()):
+            handler(state, fact_id, fact_type, attrs, fact)
+            name = _handler_name(handler)
+            counts[name] = counts.get(name, 0) + 1
+
+
+def _conflict_hints(state: _NormalizeState) -> List[Dict[str, Any]]:
+    """Conflict hints from the conflict index; linear in the number of indexed facts
+    plus sorting the distinct (target, scope) keys for a stable output order."""
+    index = state.conflict_index
+    hints: List[Dict[str, Any]] = []
+    for fact_type, hint_type, label in _MODE_CONFLICTS:
+        modes = {mode for by_mode in index.get(fact_type, {}).values() for mode in by_mode if mode}
+        if len(modes) > 1:
+            hints.append(
                 {
-                    "source_fact_ref": fact_id,
-                    "role": attrs.get("role", "unknown"),
-                    "reason": "escalated_authority",
+                    "type": hint_type,
+                    "modes": sorted(modes),
+                    "reason": f"multiple {label} restriction modes detected",
                 }
             )
-        if fact_type in ("evidence_required", "approval_required"):
-            evidence = attrs.get("evidence")
-            if evidence:
-                evidence_candidates.append(
-                    {"source_fact_ref": fact_id, "evidence": evidence, "required": True}
-                )
-            if fact_type == "approval_required":
-                precedence_candidates.append(
-                    {
-                        "source_fact_ref": fact_id,
-                        "mode": "specialization+overlays+enterprise-object",
-                        "reason": "approval_required",
-                    }
-                )
-        if fact_type == "exception_request":
-            exception_candidates.append(
+
+    for fact_type, hint_type, label in _TARGET_MODE_CONFLICTS:
+        for (target, scope), by_mode in sorted(index.get(fact_type, {}).items()):
+            modes = sorted(mode for mode in by_mode if mode)
+            if not target or len(modes) < 2:
+                continue
+            hints.append(
                 {
-                    "source_fact_ref": fact_id,
-                    "request_type": attrs.get("type", "unspecified"),
-                    "scope": attrs.get("scope", "workspace"),
+                    "type": hint_type,
+                    "modes": modes,
+                    "reason": f"multiple {label} modes for target {target}",
+                    "target": target,
+                    "scope": scope,
+                    "fact_refs": [ref for mode in modes for ref in by_mode[mode]],
                 }
             )
-        if fact_type == "publication_restriction" and attrs.get("mode"):
-            publication_modes.add(attrs["mode"])
-        if fact_type == "distribution_restriction" and attrs.get("mode"):
-            distribution_modes.add(attrs["mode"])
 
-    if not precedence_candidates:
-        unresolved_ambiguities.append(
-            {
-                "reason": "missing_precedence_hint",
-                "suggested_mode": "specialization+overlays+enterprise-object",
-            }
-        )
-    if len(publication_modes) > 1:
-        conflict_hints.append(
+    denied: Dict[Tuple[str, str], List[str]] = {}
+    for fact_type in _DENY_FACT_TYPES:
+        for key, by_mode in index.get(fact_type, {}).items():
+            if "deny" in by_mode:
+                denied.setdefault(key, []).extend(by_mode["deny"])
+    for key, by_mode in sorted(index.get("approval_required", {}).items()):
+        target, scope = key
+        if not target or key not in denied:
+            continue
+        hints.append(
             {
-                "type": "publication_mode_conflict",
-                "modes": sorted(publication_modes),
-                "reason": "multiple publication restriction modes detected",
+                "type": "approval_target_denied",
+                "modes": ["deny"],
+                "reason": f"approval required for target {target} that is denied outright",
+                "target": target,
+                "scope": scope,
+                "fact_refs": [ref for refs in by_mode.values() for ref in refs] + denied[key],
             }
         )
-    if len(distribution_modes) > 1:
-        conflict_hints.append(
+    return hints
+
+
+def _normalized_from_state(
+    state: _NormalizeState,
+    normalized_id: str,
+    source_refs: List[str],
+    head: Dict[str, Any],
+    notes: str,
+    generated_at: str,
+) -> Dict[str, Any]:
+    unresolved_ambiguities = list(state.unresolved_ambiguities)
+    if not state.precedence_candidates:
+        unresolved_ambiguities.append(
             {
-                "type": "distribution_mode_conflict",
-                "modes": sorted(distribution_modes),
-                "reason": "multiple distribution restriction modes detected",
+                "reason": "missing_precedence_hint",
+                "suggested_mode": "specialization+overlays+enterprise-object",
             }
         )
+    conflict_hints = _conflict_hints(state)
 
     build_readiness = "ready_candidate"
     if unresolved_ambiguities or conflict_hints:
@@ -414,37 +1274,181 @@ def _normalize(source_path: Path, parsed_path: Path | None, out: Path | None) ->
     normalized = {
         "kind": "enterprise_governance_normalized",
         "schema_version": "v1",
-        "normalized_id": f"norm.{_source_id(source).replace('.', '-')}",
-        "source_refs": [source["source_id"]],
-        "parsed_fact_refs": [f.get("fact_id") for f in facts if f.get("fact_id")],
-        "organization_scope": source.get("organization_scope", {}),
-        "workspace_targets": source.get("workspace_targets", []),
-        "domain_targets": source.get("domain_targets", []),
-        "specialization_targets": source.get("specialization_targets", []),
-        "rule_candidates": rule_candidates,
-        "authority_candidates": authority_candidates,
-        "evidence_candidates": evidence_candidates,
-        "precedence_candidates": precedence_candidates,
-        "exception_candidates": exception_candidates,
+        "normalized_id": normalized_id,
+        "source_refs": source_refs,
+        "parsed_fact_refs": state.fact_refs,
+        **head,
+        "rule_candidates": state.rule_candidates,
+        "authority_candidates": state.authority_candidates,
+        "evidence_candidates": state.evidence_candidates,
+        "precedence_candidates": state.precedence_candidates,
+        "exception_candidates": state.exception_candidates,
         "apply_mode_hints": ["workspace_attach"],
         "unresolved_ambiguities": unresolved_ambiguities,
         "conflict_hints": conflict_hints,
         "build_readiness": build_readiness,
-        "notes": source.get("notes", ""),
-        "generated_at": _now_iso(),
+        "notes": notes,
+        "generated_at": generated_at,
     }
+    return normalized
 
-    dst = _normalized_path(source, out)
-    _write_json(dst, normalized)
+
+def _normalized_doc(
+    source: Dict[str, Any], parsed: Dict[str, Any], state: _NormalizeState | None = None
+) -> Dict[str, Any]:
+    state = state if state is not None else _NormalizeState()
+    _normalize_facts(state, parsed)
+    head = {
+        "organization_scope": source.get("organization_scope", {}),
+        "workspace_targets": source.get("workspace_targets", []),
+        "domain_targets": source.get("domain_targets", []),
+        "specialization_targets": source.get("specialization_targets", []),
+    }
+    return _normalized_from_state(
+        state,
+        f"norm.{_source_id(source).replace('.', '-')}",
+        [source["source_id"]],
+        head,
+        source.get("notes", ""),
+        _stamp_iso(source),
+    )
+
+
+def _source_org(source: Dict[str, Any]) -> str:
+    return str(source.get("owner", {}).get("organization_id", "org")).strip() or "org"
+
+
+def _merged_head(sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+    org_ids: List[str] = []
+    scope: Dict[str, Any] = {}
+    targets: Dict[str, List[str]] = {"workspace_targets": [], "domain_targets": [], "specialization_targets": []}
+    for source in sources:
+        source_scope = source.get("organization_scope", {})
+        for key, value in source_scope.items():
+            scope.setdefault(key, value)
+        for org_id in source_scope.get("organization_ids", []):
+            if org_id not in org_ids:
+                org_ids.append(org_id)
+        for key, merged in targets.items():
+            merged.extend(t for t in source.get(key, []) if t not in merged)
+    if org_ids:
+        scope["organization_ids"] = org_ids
+    return {"organization_scope": scope, **targets}
+
+
+def _merged_normalized_doc(
+    org: str, inputs: List[Tuple[Dict[str, Any], Dict[str, Any]]], state: _NormalizeState | None = None
+) -> Dict[str, Any]:
+    """One normalized IR for all of an organization's sources.
+
+    Fact refs are qualified as <source_id>:<fact_id> since fact ids are only
+    unique within a source.
+    """
+    state = state if state is not None else _NormalizeState()
+    for source, parsed in inputs:
+        _normalize_facts(state, parsed, f"{source['source_id']}:")
+    sources = [source for source, _ in inputs]
+    return _normalized_from_state(
+        state,
+        f"norm.{org}.merged",
+        [str(source["source_id"]) for source in sources],
+        _merged_head(sources),
+        f"merged from {len(sources)} sources",
+        _stamp_iso(*sources),
+    )
+
+
+def _merged_normalized_path(org: str, out: Path | None) -> Path:
+    # Kept out of normalized/: lookups there resolve a source to its own IR.
+    if out is not None:
+        return out
+    return INGESTION_DIR / "merged" / f"{org}.merged.normalized.v1.json"
+
+
+def _merge(
+    source_paths: List[Path],
+    organization: str | None,
+    out: Path | None,
+    force: bool = False,
+    compact: bool = False,
+) -> Path:
+    selected: List[Tuple[Path, Dict[str, Any]]] = []
+    for path in source_paths:
+        source = _load_source(path)
+        if organization is None or _source_org(source) == organization:
+            selected.append((path, source))
+    if not selected:
+        raise ValueError(f"no sources selected for organization {organization or '-'}")
+    orgs = sorted({_source_org(source) for _, source in selected})
+    if len(orgs) > 1:
+        raise ValueError(f"sources span several organizations ({', '.join(orgs)}); pass --organization")
+    org = orgs[0]
+
+    # Parse through the stage cache so the merge always reads current facts.
+    parsed_paths = [_parse(path, None) for path, _ in selected]
+    dst = _merged_normalized_path(org, out)
+    merged_source = {"source_id": f"{org}.merged"}
+    inputs_for_key = [p for (path, _), parsed in zip(selected, parsed_paths) for p in (path, parsed)]
+    key = _stage_key("merge", inputs_for_key, dst)
+    if not force and _stage_cache_hit(merged_source, "merge", key, dst):
+        _ensure_sidecar(dst)
+        return dst
+    with _PROFILER.stage("merge", merged_source["source_id"]) as record:
+        load = (lambda p: _compact_facts(_read_json(p))) if compact else _read_json
+        inputs = [(source, load(parsed)) for (_, source), parsed in zip(selected, parsed_paths)]
+        state = _NormalizeState()
+        merged = _merged_normalized_doc(org, inputs, state)
+        _record_handler_counts(record, state)
+        record["counts"].update(
+            {
+                "sources": len(inputs),
+                "facts": len(merged["parsed_fact_refs"]),
+                "conflict_hints": len(merged["conflict_hints"]),
+            }
+        )
+    _write_json(dst, merged)
+    _write_sidecar(dst, merged)
+    _stage_cache_store(merged_source, "merge", key, dst)
     return dst
 
 
-def _build_candidate(source_path: Path, normalized_path: Path | None, out: Path | None) -> Path:
+def _build_candidate(source_path: Path, normalized_path: Path | None, out: Path | None, force: bool = False) -> Path:
     source_path_abs = source_path.resolve()
     source = _load_source(source_path_abs)
     normalized_doc_path = normalized_path or _normalized_path(source, None)
-    normalized = _read_json(normalized_doc_path)
+    dst = _candidate_path_from_source(source, out)
+    key = _stage_key("build-candidate", [source_path_abs, normalized_doc_path], dst)
+    if not force and _stage_cache_hit(source, "build-candidate", key, dst):
+        return dst
+    candidate = _profiled_candidate(source, source_path_abs, _read_json(normalized_doc_path), normalized_doc_path)
+    _write_json(dst, candidate)
+    _stage_cache_store(source, "build-candidate", key, dst)
+    return dst
+
 
+def _profiled_candidate(
+    source: Dict[str, Any],
+    source_path_abs: Path,
+    normalized: Dict[str, Any],
+    normalized_doc_path: Path,
+) -> Dict[str, Any]:
+    with _PROFILER.stage("build-candidate", _source_id(source)) as record:
+        candidate = _candidate_doc(source, source_path_abs, normalized, normalized_doc_path)
+        record["counts"].update(
+            {
+                "rule_candidates": len(normalized.get("rule_candidates", [])),
+                "conflict_hints": len(normalized.get("conflict_hints", [])),
+            }
+        )
+    return candidate
+
+
+def _candidate_doc(
+    source: Dict[str, Any],
+    source_path_abs: Path,
+    normalized: Dict[str, Any],
+    normalized_doc_path: Path,
+) -> Dict[str, Any]:
     org = str(source.get("owner", {}).get("organization_id", "org")) or "org"
     sid = _source_id(source).replace(".", "-")
     candidate_id = f"enterprise.{org}.{sid}.candidate.v1"
@@ -481,7 +1485,7 @@ def _build_candidate(source_path: Path, normalized_path: Path | None, out: Path
         "schema_version": "v1",
         "id": candidate_id,
         "name": f"{source.get('title', 'Enterprise Governance')} Candidate",
-        "version": datetime.now(timezone.utc).strftime("%Y.%m"),
+        "version": _build_time([source]).strftime("%Y.%m"),
         "owner": source.get("owner", {}),
         "organization_scope": normalized.get("organization_scope", {}),
         "workspace_targets": normalized.get("workspace_targets", []),
@@ -537,23 +1541,180 @@ def _build_candidate(source_path: Path, normalized_path: Path | None, out: Path
             "created_by": "tools/gen/deterministic_governance_ingestion.py",
             "updated_by": "tools/gen/deterministic_governance_ingestion.py",
             "normalized_ref": _repo_rel(normalized_doc_path),
-            "generated_at": _now_iso(),
+            "generated_at": _stamp_iso(source),
         },
         "notes": f"candidate built from deterministic ingestion; unresolved={len(unresolved)} conflicts={len(conflicts)}",
     }
+    return candidate
 
-    dst = _candidate_path_from_source(source, out)
-    _write_json(dst, candidate)
-    return dst
+
+INTERMEDIATE_MODES = ("skip", "sync", "async")
+
+_WRITE_POOL: ThreadPoolExecutor | None = None
+_PENDING_WRITES: List[Future] = []
+
+
+def _submit_write(fn: Callable[[], None]) -> None:
+    global _WRITE_POOL
+    if _WRITE_POOL is None:
+        _WRITE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest-writer")
+    _PENDING_WRITES.append(_WRITE_POOL.submit(fn))
+
+
+def _drain_writes() -> None:
+    while _PENDING_WRITES:
+        _PENDING_WRITES.pop(0).result()
+
+
+def _run_cache_hit(
+    source: Dict[str, Any],
+    source_path_abs: Path,
+    payload: Path,
+    parsed_dst: Path,
+    normalized_dst: Path,
+    candidate_dst: Path,
+) -> bool:
+    # Same keys as the individual stages, checked front to back so a miss stops
+    # before hashing artifacts that are about to be replaced anyway.
+    return (
+        _stage_cache_hit(source, "parse", _stage_key("parse", [source_path_abs, payload], parsed_dst), parsed_dst)
+        and _stage_cache_hit(
+            source,
+            "normalize",
+            _stage_key("normalize", [source_path_abs, parsed_dst], normalized_dst),
+            normalized_dst,
+        )
+        and _stage_cache_hit(
+            source,
+            "build-candidate",
+            _stage_key("build-candidate", [source_path_abs, normalized_dst], candidate_dst),
+            candidate_dst,
+        )
+    )
+
+
+def _write_intermediates(
+    source: Dict[str, Any],
+    source_path_abs: Path,
+    payload: Path,
+    parsed_dst: Path,
+    parsed: Dict[str, Any],
+    normalized_dst: Path,
+    normalized: Dict[str, Any],
+    candidate_dst: Path,
+) -> None:
+    _write_json(parsed_dst, parsed)
+    _write_sidecar(parsed_dst, parsed)
+    _stage_cache_store(source, "parse", _stage_key("parse", [source_path_abs, payload], parsed_dst), parsed_dst)
+    _write_json(normalized_dst, normalized)
+    _write_sidecar(normalized_dst, normalized)
+    _stage_cache_store(
+        source,
+        "normalize",
+        _stage_key("normalize", [source_path_abs, parsed_dst], normalized_dst),
+        normalized_dst,
+    )
+    _stage_cache_store(
+        source,
+        "build-candidate",
+        _stage_key("build-candidate", [source_path_abs, normalized_dst], candidate_dst),
+        candidate_dst,
+    )
+
+
+def _discard_intermediates(source: Dict[str, Any], parsed_dst: Path, normalized_dst: Path) -> None:
+    # skip mode: parsed/normalized artifacts from an earlier run no longer match
+    # the candidate, so remove them (and their sidecars and stage cache records)
+    # rather than leave lookups to pair the new candidate with stale IR.
+    for path in (parsed_dst, normalized_dst):
+        path.unlink(missing_ok=True)
+        sidecars.sidecar_path(path).unlink(missing_ok=True)
+    for stage in ("parse", "normalize", "build-candidate"):
+        _stage_cache_path(source, stage).unlink(missing_ok=True)
+
+
+def _run(source_path: Path, intermediates: str = "async", force: bool = False, compact: bool = False) -> Path:
+    """parse -> normalize -> build-candidate with documents handed over in memory.
+
+    The candidate is always written. Parsed and normalized artifacts are written
+    before returning (sync), queued on a background writer (async; see
+    _drain_writes), or not at all (skip). compact keeps parsed facts as
+    FactRecords in between.
+
+    Stage cache records are stored with the intermediates, since every stage
+    key hashes the previous stage's artifact. A full cache hit returns the
+    existing candidate in every mode. Otherwise skip removes the source's
+    parsed/normalized artifacts and cache records, so the next run of any mode
+    rebuilds every stage.
+    """
+    source_path_abs = source_path.resolve()
+    source = _load_source(source_path_abs)
+    payload = _payload_path(source)
+    parsed_dst = _parsed_path(source, None)
+    normalized_dst = _normalized_path(source, None)
+    candidate_dst = _candidate_path_from_source(source, None)
+    if not force and _run_cache_hit(source, source_path_abs, payload, parsed_dst, normalized_dst, candidate_dst):
+        if intermediates != "skip":
+            _ensure_sidecar(parsed_dst)
+            _ensure_sidecar(normalized_dst)
+        return candidate_dst
+
+    parsed = _parsed_doc(source, payload, compact)
+    normalized = _profiled_normalize(source, parsed)
+    candidate = _profiled_candidate(source, source_path_abs, normalized, normalized_dst)
+    with _PROFILER.stage("write-candidate", _source_id(source)):
+        _write_json(candidate_dst, candidate)
+
+    if intermediates == "skip":
+        _discard_intermediates(source, parsed_dst, normalized_dst)
+        return candidate_dst
+
+    def flush() -> None:
+        with _PROFILER.stage("write-intermediates", _source_id(source)):
+            _write_intermediates(
+                source, source_path_abs, payload, parsed_dst, parsed, normalized_dst, normalized, candidate_dst
+            )
+
+    if intermediates == "async":
+        _submit_write(flush)
+    else:
+        flush()
+    return candidate_dst
+
+
+# Compiled validators keyed by (resolved schema path, mtime_ns): a batch pays
+# for each schema once per process instead of once per artifact.
+_VALIDATOR_CACHE: Dict[Tuple[str, int], Any] = {}
+
+
+def _schema_validator(schema_path: Path) -> Any:
+    from jsonschema import Draft202012Validator
+
+    resolved = schema_path.resolve()
+    key = (str(resolved), resolved.stat().st_mtime_ns)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        for stale in [k for k in _VALIDATOR_CACHE if k[0] == key[0]]:
+            del _VALIDATOR_CACHE[stale]
+        validator = Draft202012Validator(_read_json(resolved))
+        _VALIDATOR_CACHE[key] = validator
+    return validator
+
+
+def _warm_validators() -> None:
+    # Precompile the pipeline schemas up front (e.g. once per pool worker).
+    for schema_path in (SOURCE_SCHEMA, PARSED_SCHEMA, NORMALIZED_SCHEMA, CANDIDATE_SCHEMA):
+        try:
+            _schema_validator(schema_path)
+        except Exception:
+            continue
 
 
 def _schema_validate(instance: Dict[str, Any], schema_path: Path) -> List[str]:
     try:
-        from jsonschema import Draft202012Validator
-    except Exception as exc:
+        validator = _schema_validator(schema_path)
+    except ImportError as exc:
         return [f"jsonschema unavailable: {exc}"]
-    schema = _read_json(schema_path)
-    validator = Draft202012Validator(schema)
     errors = []
     for err in sorted(validator.iter_errors(instance), key=lambda e: list(e.path)):
         where = "$." + ".".join(str(x) for x in err.path) if err.path else "$"
@@ -561,44 +1722,358 @@ def _schema_validate(instance: Dict[str, Any], schema_path: Path) -> List[str]:
     return errors
 
 
-def _validate(source_path: Path, parsed_path: Path | None, normalized_path: Path | None, candidate_path: Path | None) -> int:
+_VALIDATION_ARTIFACTS = (
+    ("source", SOURCE_SCHEMA),
+    ("parsed", PARSED_SCHEMA),
+    ("normalized", NORMALIZED_SCHEMA),
+    ("candidate", CANDIDATE_SCHEMA),
+)
+
+
+def _validation_tasks(
+    source_path: Path,
+    parsed_path: Path | None,
+    normalized_path: Path | None,
+    candidate_path: Path | None,
+) -> List[Tuple[str, str, Path, Path]]:
+    """(source_id, artifact name, artifact path, schema) in reporting order."""
     source = _read_json(source_path)
-    parsed_doc = _read_json(parsed_path or _parsed_path(source, None))
-    normalized_doc = _read_json(normalized_path or _normalized_path(source, None))
-    candidate_doc = _read_json(candidate_path or _candidate_path_from_source(source, None))
+    source_id = str(source.get("source_id", "-"))
+    paths = (
+        source_path,
+        parsed_path or _parsed_path(source, None),
+        normalized_path or _normalized_path(source, None),
+        candidate_path or _candidate_path_from_source(source, None),
+    )
+    return [(source_id, name, path, schema) for (name, schema), path in zip(_VALIDATION_ARTIFACTS, paths)]
 
-    checks: List[Tuple[str, Dict[str, Any], Path]] = [
-        ("source", source, SOURCE_SCHEMA),
-        ("parsed", parsed_doc, PARSED_SCHEMA),
-        ("normalized", normalized_doc, NORMALIZED_SCHEMA),
-        ("candidate", candidate_doc, CANDIDATE_SCHEMA),
-    ]
 
-    failed = False
-    for name, doc, schema_path in checks:
+def _validate_artifact(task: Tuple[str, str, Path, Path]) -> Dict[str, Any]:
+    source_id, name, path, schema_path = task
+    doc = _read_json(path)
+    with _PROFILER.stage(f"validate:{name}", source_id) as record:
         errors = _schema_validate(doc, schema_path)
+        record["counts"]["errors"] = len(errors)
+    return {"name": name, "errors": errors, "status": doc.get("status")}
+
+
+def _validate_artifact_worker(task: Tuple[str, str, Path, Path]) -> Dict[str, Any]:
+    result = _validate_artifact(task)
+    result["trace"] = _PROFILER.drain()
+    return result
+
+
+def _validation_lines(results: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
+    # results are the four artifacts of one source, in _VALIDATION_ARTIFACTS order.
+    lines: List[str] = []
+    failed = False
+    for result in results:
+        name, errors = result["name"], result["errors"]
         jsonschema_missing = any(e.startswith("jsonschema unavailable:") for e in errors)
         if jsonschema_missing:
-            print(f"[ingest-validate] WARN {name}: {errors[0]}")
+            lines.append(f"[ingest-validate] WARN {name}: {errors[0]}")
             continue
         if errors:
             failed = True
-            print(f"[ingest-validate] FAIL {name}")
+            lines.append(f"[ingest-validate] FAIL {name}")
             for err in errors:
-                print(f"- {err}")
+                lines.append(f"- {err}")
         else:
-            print(f"[ingest-validate] OK {name}")
+            lines.append(f"[ingest-validate] OK {name}")
 
-    if candidate_doc.get("status") != "candidate":
+    if results[-1]["status"] != "candidate":
         failed = True
-        print("[ingest-validate] FAIL candidate status must be candidate")
+        lines.append("[ingest-validate] FAIL candidate status must be candidate")
+
+    if not failed:
+        lines.append("[ingest-validate] OK pipeline artifacts")
+    return not failed, lines
+
+
+def _validate_checks(
+    source_path: Path,
+    parsed_path: Path | None,
+    normalized_path: Path | None,
+    candidate_path: Path | None,
+) -> Tuple[bool, List[str]]:
+    tasks = _validation_tasks(source_path, parsed_path, normalized_path, candidate_path)
+    return _validation_lines([_validate_artifact(task) for task in tasks])
+
+
+def _validate_many(task_groups: List[List[Tuple[str, str, Path, Path]]], jobs: int) -> List[List[Dict[str, Any]]]:
+    """Validate every artifact of every source; results keep the input order.
+
+    jsonschema is pure Python, so parallel runs use processes. Each artifact is
+    its own task (workers read the JSON themselves, nothing large is pickled),
+    which spreads one big parsed document and many small sources alike.
+    """
+    flat = [task for group in task_groups for task in group]
+    if jobs <= 1 or len(flat) <= 1:
+        _warm_validators()
+        results = [_validate_artifact(task) for task in flat]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(flat)),
+            initializer=_batch_worker_init,
+            initargs=(_worker_settings(), True),
+        ) as pool:
+            results = list(pool.map(_validate_artifact_worker, flat))
+        for result in results:
+            _PROFILER.records.extend(result.pop("trace"))
+    grouped: List[List[Dict[str, Any]]] = []
+    pos = 0
+    for group in task_groups:
+        grouped.append(results[pos : pos + len(group)])
+        pos += len(group)
+    return grouped
+
+
+def _validate(
+    sources: List[Path],
+    sources_dir: Path | None,
+    manifest: Path | None,
+    parsed_path: Path | None,
+    normalized_path: Path | None,
+    candidate_path: Path | None,
+    jobs: int = 1,
+) -> int:
+    paths = _batch_source_paths(sources, sources_dir, manifest)
+    if not paths:
+        print("[ingest-validate] FAIL no sources selected")
+        return 2
+    if len(paths) > 1 and (parsed_path or normalized_path or candidate_path):
+        print("[ingest-validate] FAIL --parsed/--normalized/--candidate need exactly one source")
+        return 2
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    task_groups = [_validation_tasks(p, parsed_path, normalized_path, candidate_path) for p in paths]
+    failed = 0
+    for path, results in zip(paths, _validate_many(task_groups, jobs)):
+        ok, lines = _validation_lines(results)
+        if len(paths) > 1:
+            print(f"[ingest-validate] source {_repo_rel(path)}")
+        for line in lines:
+            print(line)
+        failed += 0 if ok else 1
+    if len(paths) > 1:
+        print(f"[ingest-validate] {len(paths)} sources, {failed} failed")
+    if failed:
+        return 1
+    return 0
+
+
+def _batch_source_paths(sources: List[Path], sources_dir: Path | None, manifest: Path | None) -> List[Path]:
+    paths: List[Path] = list(sources)
+    if sources_dir is not None:
+        paths.extend(sorted(p for p in sources_dir.glob("*.json") if p.is_file()))
+    if manifest is not None:
+        for raw in manifest.read_text(encoding="utf-8").splitlines():
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            p = Path(line)
+            paths.append(p if p.is_absolute() else ROOT / p)
+    return paths
+
+
+def _batch_one(source_path: Path, force: bool = False, validate: bool = False, compact: bool = False) -> Dict[str, Any]:
+    started = time.perf_counter()
+    hits_before = _CACHE_STATS["hit"]
+    row: Dict[str, Any] = {
+        "source": _repo_rel(source_path),
+        "source_id": "-",
+        "status": "ok",
+        "candidate": "-",
+        "parsed": "-",
+        "normalized": "-",
+        "validation": "skipped",
+        "error": "",
+        "worker": os.getpid(),
+        "elapsed": 0.0,
+        "trace": [],
+    }
+    with _PROFILER.stage("source", _repo_rel(source_path)) as record:
+        try:
+            source = _load_source(source_path)
+            row["source_id"] = str(source["source_id"])
+            record["source_id"] = row["source_id"]
+            candidate = _run(source_path, "sync", force, compact)
+            row["candidate"] = _repo_rel(candidate)
+            row["parsed"] = _repo_rel(_parsed_path(source, None))
+            row["normalized"] = _repo_rel(_normalized_path(source, None))
+            if _CACHE_STATS["hit"] - hits_before == 3:
+                row["status"] = "cached"
+            if validate:
+                ok, lines = _validate_checks(source_path, None, None, candidate)
+                row["validation"] = "ok" if ok else "failed"
+                if not ok:
+                    row["status"] = "error"
+                    row["error"] = "; ".join(line for line in lines if not line.startswith("[ingest-validate] OK"))
+        except Exception as exc:
+            row["status"] = "error"
+            row["error"] = str(exc)
+        record["counts"]["status"] = row["status"]
+    row["elapsed"] = time.perf_counter() - started
+    # Worker processes hand their trace records and not-yet-synced artifact
+    # paths back with the row; the parent owns the trace file and the fsync pass.
+    row["trace"] = _PROFILER.drain()
+    row["written"] = _WRITER.take_pending()
+    return row
+
+
+def _worker_settings() -> Dict[str, Any]:
+    # Process-wide options set from the CLI, replayed in pool workers.
+    return {
+        "profile": _PROFILER.mode,
+        "sidecars": _SIDECARS["enabled"],
+        "timestamps": _CLOCK["mode"],
+        "fsync": _WRITER.fsync,
+        "json_style": _WRITER.style,
+    }
+
+
+def _batch_worker_init(settings: Dict[str, Any], validate: bool) -> None:
+    _PROFILER.configure(settings["profile"] if settings["profile"] != "off" else "")
+    _configure_sidecars(settings["sidecars"])
+    _configure_timestamps(settings["timestamps"])
+    _WRITER.configure(settings["fsync"], settings["json_style"])
+    if validate:
+        _warm_validators()
+
+
+def _batch_rows(
+    paths: List[Path],
+    jobs: int,
+    force: bool = False,
+    validate: bool = False,
+    compact: bool = False,
+) -> List[Dict[str, Any]]:
+    # Sources are independent, so workers may finish in any order; map() keeps
+    # results in input order and every artifact path is per-source, which makes
+    # the parallel run produce the same files as the serial one.
+    if jobs <= 1 or len(paths) <= 1:
+        if validate:
+            _warm_validators()
+        return [_batch_one(p, force, validate, compact) for p in paths]
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(paths)),
+        initializer=_batch_worker_init,
+        initargs=(_worker_settings(), validate),
+    ) as pool:
+        n = len(paths)
+        return list(pool.map(_batch_one, paths, [force] * n, [validate] * n, [compact] * n))
+
+
+def _print_worker_throughput(rows: List[Dict[str, Any]]) -> None:
+    per_worker: Dict[int, List[float]] = {}
+    for r in rows:
+        per_worker.setdefault(int(r["worker"]), []).append(float(r["elapsed"]))
+    print("\nWorkers")
+    print(f"  {'Pid':<10} {'Sources':<8} {'Busy s':<10} {'Sources/s'}")
+    for pid in sorted(per_worker):
+        elapsed = per_worker[pid]
+        busy = sum(elapsed)
+        rate = len(elapsed) / busy if busy > 0 else 0.0
+        print(f"  {pid:<10} {len(elapsed):<8} {busy:<10.3f} {rate:.1f}")
+
+
+def _batch(
+    sources: List[Path],
+    sources_dir: Path | None,
+    manifest: Path | None,
+    jobs: int = 1,
+    force: bool = False,
+    validate: bool = False,
+    compact: bool = False,
+) -> int:
+    paths = _batch_source_paths(sources, sources_dir, manifest)
+    if not paths:
+        print("[ingest-batch] FAIL no sources selected")
+        return 2
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    started = time.perf_counter()
+    rows = _batch_rows(paths, jobs, force, validate, compact)
+    wall = time.perf_counter() - started
+    written: List[Path] = []
+    for r in rows:
+        _PROFILER.records.extend(r.pop("trace"))
+        written.extend(r.pop("written"))
+    _WRITER.flush(written)
+    failed = [r for r in rows if r["status"] == "error"]
+    cached = [r for r in rows if r["status"] == "cached"]
+
+    print("Batch ingestion")
+    print("---------------")
+    print(f"{'Source id':<42} {'Status':<8} {'Candidate / error'}")
+    for r in rows:
+        detail = r["error"] if r["status"] == "error" else r["candidate"]
+        print(f"{r['source_id']:<42} {r['status']:<8} {detail}")
+    print(f"\n  Sources           {len(rows)}")
+    print(f"  Cached            {len(cached)}")
+    print(f"  Failed            {len(failed)}")
+    print(f"  Jobs              {jobs}")
+    print(f"  Wall seconds      {wall:.3f}")
+    _print_worker_throughput(rows)
 
     if failed:
         return 1
-    print("[ingest-validate] OK pipeline artifacts")
     return 0
 
 
+def _watch_payload(manifest: Path) -> Path | None:
+    try:
+        return _payload_path(_load_source(manifest))
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _watch(
+    sources_dir: Path,
+    jobs: int,
+    queue_size: int,
+    debounce: float,
+    poll_interval: float,
+    backend: str,
+    validate: bool,
+    initial_scan: bool,
+    profile_out: Path | None,
+) -> int:
+    import governance_ingestion_watcher as watcher
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    lock = threading.Lock()
+    pool = ProcessPoolExecutor(max_workers=jobs, initializer=_batch_worker_init, initargs=(_worker_settings(), validate))
+
+    def process(source_path: Path) -> None:
+        row = pool.submit(_batch_one, source_path, False, validate).result()
+        with lock:
+            _PROFILER.records.extend(row.pop("trace"))
+            _PROFILER.flush(profile_out)
+            _WRITER.flush(row.pop("written"))
+        detail = row["error"] if row["status"] == "error" else row["candidate"]
+        print(f"[ingest-watch] {row['status']} {row['source_id']} {detail} ({row['elapsed']:.3f}s)", flush=True)
+
+    w = watcher.SourceWatcher(
+        sources_dir,
+        _watch_payload,
+        process,
+        backend=backend,
+        jobs=jobs,
+        queue_size=queue_size,
+        debounce=debounce,
+        poll_interval=poll_interval,
+        log=lambda line: print(line, flush=True),
+    )
+    signal.signal(signal.SIGTERM, lambda *_: w.stop())
+    try:
+        return w.run(initial_scan)
+    finally:
+        pool.shutdown()
+
+
 def _inspect_parsed(parsed_doc: Dict[str, Any]) -> None:
     facts = parsed_doc.get("facts", [])
     coverage = parsed_doc.get("coverage_summary", {})
@@ -639,26 +2114,133 @@ def _inspect(source_path: Path, stage: str) -> int:
     return 1
 
 
+# Library entry points for in-process callers such as tools/bin/yai-govern.
+# Process-wide options come from the environment, as for a CLI run without flags.
+_LIBRARY = {"configured": False}
+
+
+@contextmanager
+def _library_call() -> Iterator[None]:
+    if not _LIBRARY["configured"]:
+        _PROFILER.configure(None)
+        _configure_sidecars(None)
+        _configure_timestamps(None)
+        _LIBRARY["configured"] = True
+    try:
+        yield
+    finally:
+        _drain_writes()
+        _WRITER.flush()
+        _PROFILER.flush(None)
+
+
+def run_stage(stage: str, source_path: Path, force: bool = False) -> Path:
+    """Run one stage (parse, normalize, build-candidate) for a source manifest and
+    return the artifact path, exactly as the matching subcommand would."""
+    with _library_call():
+        if stage == "parse":
+            return _parse(source_path, None, force)
+        if stage == "normalize":
+            return _normalize(source_path, None, None, force)
+        if stage == "build-candidate":
+            return _build_candidate(source_path, None, None, force)
+    raise ValueError(f"unknown stage: {stage}")
+
+
+def validate_source(source_path: Path) -> Tuple[bool, List[str]]:
+    """(ok, report lines) for a source's default pipeline artifacts, like `validate --source`."""
+    with _library_call():
+        return _validate_checks(source_path, None, None, None)
+
+
+def run_sources(source_paths: List[Path], jobs: int = 1, force: bool = False, validate: bool = True) -> List[Dict[str, Any]]:
+    """Run the full pipeline for many sources (like `batch`), in input order.
+
+    Rows carry source_id, status (ok/cached/error), validation
+    (ok/failed/skipped), error, elapsed, and repo-relative parsed, normalized
+    and candidate paths.
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    with _library_call():
+        rows = _batch_rows(list(source_paths), jobs, force, validate)
+        written: List[Path] = []
+        for r in rows:
+            _PROFILER.records.extend(r.pop("trace"))
+            written.extend(r.pop("written"))
+        _WRITER.flush(written)
+    return rows
+
+
 def _parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Deterministic governance ingestion engine")
+    p.add_argument(
+        "--profile",
+        dest="profile",
+        action="store_const",
+        const="1",
+        help=f"record per-stage wall/CPU time and item counts (also: {PROFILE_ENV}=1)",
+    )
+    p.add_argument(
+        "--profile-alloc",
+        dest="profile",
+        action="store_const",
+        const="alloc",
+        help=f"like --profile, plus tracemalloc allocation peaks (also: {PROFILE_ENV}=alloc)",
+    )
+    p.add_argument("--profile-out", type=Path, help="trace file to append to (NDJSON)")
+    p.add_argument(
+        "--sidecars",
+        action="store_true",
+        default=None,
+        help=f"also write binary .bin sidecars next to parsed/normalized artifacts (also: {SIDECAR_ENV}=1)",
+    )
+    p.add_argument(
+        "--fsync",
+        choices=FSYNC_MODES,
+        default="none",
+        help="artifact durability: no fsync, fsync every file, or one sync pass per command/batch",
+    )
+    p.add_argument("--json-style", choices=JSON_STYLES, default="pretty", help="artifact JSON encoding")
+    p.add_argument(
+        "--timestamps",
+        choices=TIMESTAMP_MODES,
+        help="stamp generated_at/version from the wall clock, SOURCE_DATE_EPOCH, or the sources' updated_at "
+        "(default: epoch when SOURCE_DATE_EPOCH is set, else wall)",
+    )
     sub = p.add_subparsers(dest="cmd", required=True)
 
     p_parse = sub.add_parser("parse", help="parse source -> parsed facts")
     p_parse.add_argument("--source", required=True, type=Path)
     p_parse.add_argument("--out", type=Path)
+    p_parse.add_argument("--force", action="store_true", help="ignore the stage cache")
 
     p_norm = sub.add_parser("normalize", help="normalize parsed facts -> normalized IR")
     p_norm.add_argument("--source", required=True, type=Path)
     p_norm.add_argument("--parsed", type=Path)
     p_norm.add_argument("--out", type=Path)
+    p_norm.add_argument("--force", action="store_true", help="ignore the stage cache")
 
     p_build = sub.add_parser("build-candidate", help="normalized IR -> candidate object")
     p_build.add_argument("--source", required=True, type=Path)
     p_build.add_argument("--normalized", type=Path)
     p_build.add_argument("--out", type=Path)
+    p_build.add_argument("--force", action="store_true", help="ignore the stage cache")
+
+    p_merge = sub.add_parser("merge", help="normalize many sources of one organization into one normalized IR")
+    p_merge.add_argument("--source", action="append", default=[], type=Path)
+    p_merge.add_argument("--sources-dir", type=Path, help="directory of source manifests (*.json)")
+    p_merge.add_argument("--manifest", type=Path, help="text file listing source manifests, one per line")
+    p_merge.add_argument("--organization", help="only merge sources owned by this organization id")
+    p_merge.add_argument("--out", type=Path, help="default: governance/ingestion/merged/<org>.merged.normalized.v1.json")
+    p_merge.add_argument("--force", action="store_true", help="ignore the stage cache")
+    p_merge.add_argument("--compact-facts", action="store_true", help="hold parsed facts as compact records in memory")
 
     p_val = sub.add_parser("validate", help="validate source/parsed/normalized/candidate artifacts")
-    p_val.add_argument("--source", required=True, type=Path)
+    p_val.add_argument("--source", action="append", default=[], type=Path)
+    p_val.add_argument("--sources-dir", type=Path, help="directory of source manifests (*.json)")
+    p_val.add_argument("--manifest", type=Path, help="text file listing source manifests, one per line")
+    p_val.add_argument("--jobs", type=int, default=1, help="validate artifacts in this many worker processes (0 = one per CPU)")
     p_val.add_argument("--parsed", type=Path)
     p_val.add_argument("--normalized", type=Path)
     p_val.add_argument("--candidate", type=Path)
@@ -667,28 +2249,117 @@ def _parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     p_inspect.add_argument("--source", required=True, type=Path)
     p_inspect.add_argument("--stage", required=True, choices=["parsed", "normalized"])
 
+    p_run = sub.add_parser("run", help="parse -> normalize -> build-candidate in memory for one source")
+    p_run.add_argument("--source", required=True, type=Path)
+    p_run.add_argument(
+        "--intermediates",
+        choices=INTERMEDIATE_MODES,
+        default="async",
+        help="write parsed/normalized artifacts after the candidate (async), before returning (sync), or never "
+        "(skip: also removes the source's earlier parsed/normalized artifacts and stage cache records)",
+    )
+    p_run.add_argument("--force", action="store_true", help="ignore the stage cache")
+    p_run.add_argument("--compact-facts", action="store_true", help="hold parsed facts as compact records in memory")
+
+    p_batch = sub.add_parser("batch", help="parse -> normalize -> build-candidate for many sources in one process")
+    p_batch.add_argument("--source", action="append", default=[], type=Path)
+    p_batch.add_argument("--sources-dir", type=Path, help="directory of source manifests (*.json)")
+    p_batch.add_argument("--manifest", type=Path, help="text file listing source manifests, one per line")
+    p_batch.add_argument("--jobs", type=int, default=1, help="worker processes (0 = one per CPU)")
+    p_batch.add_argument("--force", action="store_true", help="ignore the stage cache")
+    p_batch.add_argument("--validate", action="store_true", help="schema-validate each source's artifacts")
+    p_batch.add_argument("--compact-facts", action="store_true", help="hold parsed facts as compact records in memory")
+
+    p_watch = sub.add_parser("watch", help="rebuild sources whose manifest or payload changes (long-running)")
+    p_watch.add_argument("--sources-dir", type=Path, default=INGESTION_DIR / "sources")
+    p_watch.add_argument("--jobs", type=int, default=1, help="worker processes (0 = one per CPU)")
+    p_watch.add_argument("--queue-size", type=int, default=64, help="sources waiting for a worker before backpressure")
+    p_watch.add_argument("--debounce", type=float, default=0.5, help="seconds a source must be quiet before it is queued")
+    p_watch.add_argument("--poll-interval", type=float, default=1.0, help="polling backend scan interval in seconds")
+    p_watch.add_argument("--backend", choices=("auto", "inotify", "poll"), default="auto")
+    p_watch.add_argument("--validate", action="store_true", help="schema-validate each rebuilt source")
+    p_watch.add_argument("--no-initial-scan", action="store_true", help="only react to changes made after startup")
+
     return p.parse_args(argv)
 
 
 def main(argv: Iterable[str] | None = None) -> int:
     args = _parse_args(argv)
+    _PROFILER.configure(args.profile)
+    _configure_sidecars(args.sidecars)
+    _configure_timestamps(args.timestamps)
+    _WRITER.configure(args.fsync, args.json_style)
+    try:
+        return _dispatch(args)
+    finally:
+        _drain_writes()
+        _WRITER.flush()
+        trace = _PROFILER.flush(args.profile_out)
+        if trace is not None:
+            print(f"[ingest-profile] trace appended to {_repo_rel(trace)}", file=sys.stderr)
+
+
+def _dispatch(args: argparse.Namespace) -> int:
     cmd = args.cmd
     if cmd == "parse":
-        out = _parse(args.source, args.out)
+        out = _parse(args.source, args.out, args.force)
         print(out.relative_to(ROOT))
         return 0
     if cmd == "normalize":
-        out = _normalize(args.source, args.parsed, args.out)
+        out = _normalize(args.source, args.parsed, args.out, args.force)
         print(out.relative_to(ROOT))
         return 0
     if cmd == "build-candidate":
-        out = _build_candidate(args.source, args.normalized, args.out)
+        out = _build_candidate(args.source, args.normalized, args.out, args.force)
+        print(out.relative_to(ROOT))
+        return 0
+    if cmd == "merge":
+        paths = _batch_source_paths(args.source, args.sources_dir, args.manifest)
+        if not paths:
+            print("[ingest-merge] FAIL no sources selected")
+            return 2
+        out = _merge(paths, args.organization, args.out, args.force, args.compact_facts)
         print(out.relative_to(ROOT))
         return 0
     if cmd == "validate":
-        return _validate(args.source, args.parsed, args.normalized, args.candidate)
+        return _validate(
+            args.source,
+            args.sources_dir,
+            args.manifest,
+            args.parsed,
+            args.normalized,
+            args.candidate,
+            args.jobs,
+        )
     if cmd == "inspect":
         return _inspect(args.source, args.stage)
+    if cmd == "run":
+        out = _run(args.source, args.intermediates, args.force, args.compact_facts)
+        _drain_writes()
+        print(out.relative_to(ROOT))
+        return 0
+    if cmd == "watch":
+        return _watch(
+            args.sources_dir,
+            args.jobs,
+            args.queue_size,
+            args.debounce,
+            args.poll_interval,
+            args.backend,
+            args.validate,
+            not args.no_initial_scan,
+            args.profile_out,
+        )
+    if cmd == "batch":
+        return _batch(
+            args.source,
+            args.sources_dir,
+            args.manifest,
+            args.jobs,
+            args.force,
+            args.validate,
+            args.compact_facts,
+        )
     return 1
 
 
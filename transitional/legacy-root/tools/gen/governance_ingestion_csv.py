@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""csv_rule_sheet handler for the governance ingestion engine.
+
+Loaded on first use through the engine's format registry. Rows are streamed
+with the csv module; the first row is the header (case-insensitive, a UTF-8
+BOM from spreadsheet exports is ignored). A row becomes:
+
+- a statement line when its ``statement`` (or ``rule``) cell starts with
+  ``RULE ``, exactly as in markdown/YAML sheets;
+- otherwise a structured line when it has a ``fact_type`` cell, with every
+  other non-empty cell as an attribute (sorted by column name, like JSON
+  rule objects). Cells containing spaces or quotes are shell-quoted so the
+  engine's tokenizer keeps them as one value.
+
+Anything else (blank rows, notes columns only) is skipped.
+"""
+from __future__ import annotations
+
+import csv
+import shlex
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Tuple
+
+_STATEMENT_COLUMNS = ("statement", "rule")
+
+
+def rule_lines(
+    path: Path,
+    rel: str,
+    rule_line: Callable[..., Any],
+    structured: Callable[[str, List[Tuple[str, str]], str], Any],
+) -> Iterator[Any]:
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = ["_".join(name.strip().lower().split()) for name in header]
+        statement_idx = [i for i, name in enumerate(columns) if name in _STATEMENT_COLUMNS]
+        fact_type_idx = columns.index("fact_type") if "fact_type" in columns else -1
+        attr_idx = sorted(
+            (name, i) for i, name in enumerate(columns) if name and name != "fact_type" and name not in _STATEMENT_COLUMNS
+        )
+        start = reader.line_num + 1
+        for row in reader:
+            ref = f"{rel}:{start}"
+            start = reader.line_num + 1
+            statement = next((row[i].strip() for i in statement_idx if i < len(row) and row[i].strip()), "")
+            if statement.startswith("RULE "):
+                yield rule_line(statement=statement, statement_ref=ref)
+                continue
+            fact_type = row[fact_type_idx].strip() if 0 <= fact_type_idx < len(row) else ""
+            if not fact_type:
+                continue
+            pairs = [(name, shlex.quote(row[i].strip())) for name, i in attr_idx if i < len(row) and row[i].strip()]
+            yield structured(fact_type, pairs, ref)
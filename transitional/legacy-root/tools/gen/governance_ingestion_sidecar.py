@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Binary sidecars for governance ingestion artifacts.
+
+A sidecar sits next to a canonical ``*.parsed.v1.json`` / ``*.normalized.v1.json``
+artifact (same name, ``.bin`` suffix) and is only trusted while the JSON file
+still has the size and mtime recorded in it. It holds just what listings
+need: the artifact's small top-level fields and the lengths of its large
+lists (read_summary). Full documents are always read from the JSON.
+
+Layout (little endian):
+
+    header   magic "YGSC" | u16 format | u16 flags | u64 json_size |
+             u64 json_mtime_ns | u32 summary_len
+    summary  compact JSON {"kind", "fields", "counts"}
+"""
+from __future__ import annotations
+
+import json
+import os
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, IO, Iterable, Iterator, Tuple
+
+MAGIC = b"YGSC"
+# Format 1 also carried per-key sections, a string table and a directory.
+FORMAT = 2
+SUFFIX = ".bin"
+
+# Top-level keys only counted in the summary header; everything else is small
+# enough to be copied into it verbatim.
+SUMMARY_COUNTED: Dict[str, Tuple[str, ...]] = {
+    "governance_parsed_facts": ("facts", "unresolved_items", "invalid_items", "source_warnings"),
+    "enterprise_governance_normalized": (
+        "parsed_fact_refs",
+        "rule_candidates",
+        "authority_candidates",
+        "evidence_candidates",
+        "precedence_candidates",
+        "exception_candidates",
+        "unresolved_ambiguities",
+        "conflict_hints",
+    ),
+}
+
+_HEAD = struct.Struct("<4sHHQQI")
+
+
+def sidecar_path(json_path: Path) -> Path:
+    return json_path.with_suffix(SUFFIX)
+
+
+@contextmanager
+def _replace_open(dst: Path) -> Iterator[IO[bytes]]:
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            yield f
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class SidecarWriter:
+    """Builds a sidecar summary one top-level key at a time.
+
+    A counted list can be fed from the same iterator that streams the JSON
+    artifact (see tee_list), so it is never held in memory.
+    """
+
+    def __init__(self, kind: str, default: Callable[[Any], Any] | None = None) -> None:
+        self.kind = kind
+        self.default = default
+        self._counted = set(SUMMARY_COUNTED.get(kind, ()))
+        self._fields: Dict[str, Any] = {}
+        self._counts: Dict[str, int] = {}
+
+    def add(self, key: str, value: Any) -> None:
+        if key in self._counted and isinstance(value, list):
+            self._counts[key] = len(value)
+        else:
+            self._fields[key] = value
+
+    def tee_list(self, key: str, items: Iterable[Any]) -> Iterator[Any]:
+        """Yield items unchanged while counting them as the list for key."""
+        count = 0
+        for item in items:
+            count += 1
+            yield item
+        self._counts[key] = count
+
+    def finish(self, json_path: Path, open_dst: Callable[[Path], ContextManager[IO[bytes]]] | None = None) -> Path:
+        """Write the sidecar for json_path (which must already be complete).
+
+        open_dst(path) opens the destination for writing; by default a temp
+        file renamed into place.
+        """
+        st = json_path.stat()
+        summary = json.dumps(
+            {"kind": self.kind, "fields": self._fields, "counts": self._counts},
+            separators=(",", ":"),
+            ensure_ascii=True,
+            default=self.default,
+        ).encode("utf-8")
+        dst = sidecar_path(json_path)
+        with (open_dst or _replace_open)(dst) as f:
+            f.write(_HEAD.pack(MAGIC, FORMAT, 0, st.st_size, st.st_mtime_ns, len(summary)))
+            f.write(summary)
+        return dst
+
+
+def write_sidecar(
+    json_path: Path,
+    doc: Dict[str, Any],
+    default: Callable[[Any], Any] | None = None,
+    open_dst: Callable[[Path], ContextManager[IO[bytes]]] | None = None,
+) -> Path:
+    writer = SidecarWriter(str(doc.get("kind", "")), default)
+    for key, value in doc.items():
+        writer.add(key, value)
+    return writer.finish(json_path, open_dst)
+
+
+def _fresh_header(json_path: Path, f: IO[bytes]) -> int | None:
+    # -> summary_len if the sidecar matches the JSON artifact.
+    head = f.read(_HEAD.size)
+    if len(head) != _HEAD.size:
+        return None
+    magic, fmt, _flags, json_size, json_mtime_ns, summary_len = _HEAD.unpack(head)
+    if magic != MAGIC or fmt != FORMAT:
+        return None
+    try:
+        st = json_path.stat()
+    except OSError:
+        return None
+    if st.st_size != json_size or st.st_mtime_ns != json_mtime_ns:
+        return None
+    return summary_len
+
+
+def read_summary(json_path: Path) -> Dict[str, Any] | None:
+    """{"kind", "fields", "counts"} from a fresh sidecar, else None."""
+    try:
+        with sidecar_path(json_path).open("rb") as f:
+            summary_len = _fresh_header(json_path, f)
+            if summary_len is None:
+                return None
+            raw = f.read(summary_len)
+    except OSError:
+        return None
+    try:
+        return json.loads(raw.decode("utf-8"))
+    except ValueError:
+        return None
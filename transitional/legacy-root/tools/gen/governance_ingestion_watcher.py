@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Source watcher for the governance ingestion engine (``watch`` subcommand).
+
+Watches the source manifest directory, plus the directories holding the
+payloads those manifests reference. It uses inotify where available and
+polls otherwise. Changes are debounced per source and handed to a bounded
+queue that a fixed set of worker threads drains through a caller-supplied
+``process`` callback. The engine passes a callback that runs the pipeline in
+a process pool.
+"""
+from __future__ import annotations
+
+import ctypes
+import os
+import queue
+import select
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+BACKENDS = ("auto", "inotify", "poll")
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_CREATE | _IN_DELETE | _IN_MODIFY
+_EVENT = struct.Struct("iIII")
+
+# Sentinel path reported when the kernel queue overflowed: rescan everything.
+RESCAN = Path("*")
+
+
+def _relevant(name: str) -> bool:
+    # Skip editor swap files and the engine's own atomic-write temp files.
+    return bool(name) and not name.startswith(".") and not name.endswith((".tmp", ".swp", "~"))
+
+
+class _InotifyBackend:
+    name = "inotify"
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+
+    def watch_dir(self, directory: Path) -> None:
+        if directory in self._dirs.values():
+            return
+        wd = self._add_watch(self._fd, os.fsencode(str(directory)), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {directory}")
+        self._dirs[wd] = directory
+
+    def wait(self, timeout: float) -> Set[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        changed: Set[Path] = set()
+        if not ready:
+            return changed
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            pos = 0
+            while pos < len(buf):
+                wd, mask, _cookie, length = _EVENT.unpack_from(buf, pos)
+                raw = buf[pos + _EVENT.size : pos + _EVENT.size + length].rstrip(b"\0")
+                pos += _EVENT.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    changed.add(RESCAN)
+                    continue
+                name = os.fsdecode(raw)
+                directory = self._dirs.get(wd)
+                if directory is not None and _relevant(name):
+                    changed.add(directory / name)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _PollingBackend:
+    name = "poll"
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._dirs: List[Path] = []
+        self._seen: Dict[Path, tuple] = {}
+
+    def _scan(self, directory: Path) -> Dict[Path, tuple]:
+        out: Dict[Path, tuple] = {}
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            return out
+        for entry in entries:
+            if not _relevant(entry.name) or not entry.is_file():
+                continue
+            st = entry.stat()
+            out[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+        return out
+
+    def watch_dir(self, directory: Path) -> None:
+        if directory in self._dirs:
+            return
+        self._dirs.append(directory)
+        self._seen.update(self._scan(directory))
+
+    def wait(self, timeout: float) -> Set[Path]:
+        time.sleep(min(timeout, self.interval))
+        current: Dict[Path, tuple] = {}
+        for directory in self._dirs:
+            current.update(self._scan(directory))
+        changed = {p for p, sig in current.items() if self._seen.get(p) != sig}
+        changed.update(p for p in self._seen if p not in current)
+        self._seen = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class SourceWatcher:
+    """Debounced change detection -> bounded queue -> worker threads."""
+
+    def __init__(
+        self,
+        sources_dir: Path,
+        payload_of: Callable[[Path], Path | None],
+        process: Callable[[Path], None],
+        backend: str = "auto",
+        jobs: int = 1,
+        queue_size: int = 64,
+        debounce: float = 0.5,
+        poll_interval: float = 1.0,
+        log: Callable[[str], None] = print,
+    ) -> None:
+        self.sources_dir = sources_dir
+        self.payload_of = payload_of
+        self.process = process
+        self.debounce = debounce
+        self.log = log
+        self.backend = self._backend(backend, poll_interval)
+        self.jobs = max(1, jobs)
+        self._queue: "queue.Queue[Path | None]" = queue.Queue(maxsize=max(1, queue_size))
+        self._queued: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._pending: Dict[Path, float] = {}
+        self._payload_sources: Dict[Path, Set[Path]] = {}
+        self._stop = threading.Event()
+
+    def _backend(self, backend: str, poll_interval: float) -> "_InotifyBackend | _PollingBackend":
+        if backend in ("auto", "inotify"):
+            try:
+                return _InotifyBackend()
+            except (OSError, AttributeError) as exc:
+                if backend == "inotify":
+                    raise
+                self.log(f"[ingest-watch] inotify unavailable ({exc}); polling every {poll_interval}s")
+        return _PollingBackend(poll_interval)
+
+    def _track(self, manifest: Path) -> None:
+        for sources in self._payload_sources.values():
+            sources.discard(manifest)
+        payload = self.payload_of(manifest)
+        if payload is None:
+            return
+        self._payload_sources.setdefault(payload, set()).add(manifest)
+        self.backend.watch_dir(payload.parent)
+
+    def _manifests(self) -> List[Path]:
+        return sorted(p for p in self.sources_dir.glob("*.json") if p.is_file() and _relevant(p.name))
+
+    def _sources_for(self, path: Path) -> Set[Path]:
+        if path == RESCAN:
+            return set(self._manifests())
+        if path.parent == self.sources_dir and path.suffix == ".json":
+            if not path.exists():
+                self.log(f"[ingest-watch] removed {path.name}")
+                return set()
+            self._track(path)
+            return {path}
+        return set(self._payload_sources.get(path, ()))
+
+    def _enqueue_ready(self, now: float) -> None:
+        for source in sorted(p for p, t in self._pending.items() if now - t >= self.debounce):
+            with self._lock:
+                if source in self._queued:
+                    del self._pending[source]
+                    continue
+            try:
+                self._queue.put_nowait(source)
+            except queue.Full:
+                return  # still pending; retried on the next tick
+            with self._lock:
+                self._queued.add(source)
+            del self._pending[source]
+
+    def _worker(self) -> None:
+        while True:
+            source = self._queue.get()
+            if source is None:
+                return
+            with self._lock:
+                self._queued.discard(source)
+            try:
+                self.process(source)
+            except Exception as exc:  # keep the daemon alive; the callback reports details
+                self.log(f"[ingest-watch] FAIL {source.name}: {exc}")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run(self, initial_scan: bool = True) -> int:
+        self.sources_dir.mkdir(parents=True, exist_ok=True)
+        self.backend.watch_dir(self.sources_dir)
+        now = time.monotonic()
+        for manifest in self._manifests():
+            self._track(manifest)
+            if initial_scan:
+                self._pending[manifest] = now - self.debounce
+        workers = [threading.Thread(target=self._worker, name=f"ingest-watch-{i}", daemon=True) for i in range(self.jobs)]
+        for w in workers:
+            w.start()
+        self.log(
+            f"[ingest-watch] watching {self.sources_dir} ({self.backend.name}, jobs={self.jobs}, "
+            f"queue={self._queue.maxsize}, debounce={self.debounce}s)"
+        )
+        try:
+            while not self._stop.is_set():
+                timeout = self.debounce if self._pending else 1.0
+                for path in self.backend.wait(timeout):
+                    for source in self._sources_for(path):
+                        self._pending[source] = time.monotonic()
+                self._enqueue_ready(time.monotonic())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.log("[ingest-watch] stopping; draining queued sources")
+            for _ in workers:
+                self._queue.put(None)
+            for w in workers:
+                w.join()
+            self.backend.close()
+        return 0
@@ -1,21 +1,409 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import importlib.machinery
+import importlib.util
+import io
+import json
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Tuple
 
 ROOT = Path(__file__).resolve().parents[2]
 CLI = ROOT / "tools" / "bin" / "yai-govern"
 CID = "enterprise.sample.src-sample-digital-outbound.candidate.v1"
+SRC_ID = "src.sample.digital-outbound"
 REVIEW_FILE = ROOT / "governance" / "ingestion" / "review" / f"{CID}.review.v1.json"
 
+# Checks that rewrite artifacts run against a copy of these, never the tree itself.
+SCRATCH_PATHS = (
+    "tools/gen",
+    "tools/bin",
+    "governance/ingestion",
+    "governance/grammar/schema",
+    "spec/sch/model_schema",
+    "control/ingestion",
+)
+STAGES = ("parse", "normalize", "build-candidate")
+
 
 def run(*args: str) -> int:
     cmd = [str(CLI), *args]
     return subprocess.call(cmd, cwd=str(ROOT))
 
 
+def fail(msg: str) -> None:
+    raise SystemExit(f"[ingestion-cli] FAIL: {msg}")
+
+
+def scratch_root(tmp: Path) -> Path:
+    for rel in SCRATCH_PATHS:
+        src = ROOT / rel
+        if src.is_dir():
+            shutil.copytree(src, tmp / rel, ignore=shutil.ignore_patterns("__pycache__"))
+    return tmp
+
+
+def engine(root: Path, *args: str, engine_version: str | None = None) -> subprocess.CompletedProcess:
+    """Run the ingestion engine of a scratch root; engine_version overrides ENGINE_VERSION."""
+    env = {**os.environ, "SOURCE_DATE_EPOCH": "1767225600"}
+    if engine_version is None:
+        cmd = [sys.executable, str(root / "tools" / "gen" / "deterministic_governance_ingestion.py"), *args]
+    else:
+        boot = (
+            "import sys; sys.path.insert(0, 'tools/gen'); import deterministic_governance_ingestion as e; "
+            f"e.ENGINE_VERSION = {engine_version!r}; raise SystemExit(e.main(sys.argv[1:]))"
+        )
+        cmd = [sys.executable, "-c", boot, *args]
+    proc = subprocess.run(cmd, cwd=str(root), env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        fail(f"engine {' '.join(args)} rc={proc.returncode}\n{proc.stdout}{proc.stderr}")
+    return proc
+
+
+def cli(root: Path, *args: str) -> str:
+    """stdout of the yai-govern of a scratch root."""
+    proc = subprocess.run([sys.executable, str(root / "tools" / "bin" / "yai-govern"), *args], cwd=str(root), capture_output=True, text=True)
+    if proc.returncode != 0:
+        fail(f"yai-govern {' '.join(args)} rc={proc.returncode}\n{proc.stdout}{proc.stderr}")
+    return proc.stdout
+
+
+def source_paths(root: Path, source_id: str) -> Tuple[Path, Path, Path, Path]:
+    """(manifest, parsed, normalized, candidate) for a source of a scratch root."""
+    ing = root / "governance" / "ingestion"
+    manifest = ing / "sources" / f"{source_id}.source.v1.json"
+    org = json.loads(manifest.read_text(encoding="utf-8"))["owner"]["organization_id"]
+    slug = source_id.replace(".", "-")
+    return (
+        manifest,
+        ing / "parsed" / f"{source_id}.parsed.v1.json",
+        ing / "normalized" / f"{source_id}.normalized.v1.json",
+        ing / "candidates" / f"enterprise.{org}.{slug}.candidate.v1.json",
+    )
+
+
+def stage_cache_hits(root: Path, manifest: Path, *flags: str, engine_version: str | None = None) -> Dict[str, bool]:
+    """Run parse, normalize and build-candidate; stage -> served from the stage cache."""
+    hits: Dict[str, bool] = {}
+    trace = root / "trace.ndjson"
+    for stage in STAGES:
+        trace.unlink(missing_ok=True)
+        engine(root, "--profile", "--profile-out", str(trace), stage, "--source", str(manifest), *flags, engine_version=engine_version)
+        records = [json.loads(line) for line in trace.read_text(encoding="utf-8").splitlines()]
+        hits[stage] = any(r["stage"] == stage and r["cached"] for r in records)
+    return hits
+
+
+def snapshot(paths: Tuple[Path, ...]) -> List[Tuple[bytes, int]]:
+    return [(p.read_bytes(), p.stat().st_mtime_ns) for p in paths]
+
+
+def check_stage_cache(root: Path) -> None:
+    manifest, parsed, normalized, candidate = source_paths(root, SRC_ID)
+    artifacts = (parsed, normalized, candidate)
+    all_hit = dict.fromkeys(STAGES, True)
+    all_miss = dict.fromkeys(STAGES, False)
+
+    stage_cache_hits(root, manifest, "--force")
+    built = snapshot(artifacts)
+    hits = stage_cache_hits(root, manifest)
+    if hits != all_hit:
+        fail(f"stage cache: unchanged inputs should hit every stage, got {hits}")
+    if snapshot(artifacts) != built:
+        fail("stage cache: a cache hit rewrote an artifact")
+
+    hits = stage_cache_hits(root, manifest, "--force")
+    if hits != all_miss:
+        fail(f"stage cache: --force should bypass the cache, got {hits}")
+    if [data for data, _ in snapshot(artifacts)] != [data for data, _ in built]:
+        fail("stage cache: a forced rebuild of unchanged inputs changed artifact bytes")
+
+    hits = stage_cache_hits(root, manifest, engine_version="validate-ingestion-cli")
+    if hits != all_miss:
+        fail(f"stage cache: a new ENGINE_VERSION should miss every stage, got {hits}")
+    stage_cache_hits(root, manifest)
+
+    doc = json.loads(manifest.read_text(encoding="utf-8"))
+    payload = root / doc["source_payload_ref"]
+    with payload.open("a", encoding="utf-8") as f:
+        f.write("- RULE evidence_required evidence=validate_ingestion_cli\n")
+    hits = stage_cache_hits(root, manifest)
+    if hits != all_miss:
+        fail(f"stage cache: an edited payload should miss every stage, got {hits}")
+    if parsed.read_bytes() == built[0][0]:
+        fail("stage cache: parsed facts unchanged after a payload edit")
+
+    doc["notes"] = f"{doc.get('notes', '')} (edited)"
+    manifest.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+    hits = stage_cache_hits(root, manifest)
+    if hits != all_miss:
+        fail(f"stage cache: an edited source manifest should miss every stage, got {hits}")
+
+
+def check_run_skip_intermediates(root: Path) -> None:
+    manifest, parsed, normalized, candidate = source_paths(root, SRC_ID)
+    engine(root, "run", "--source", str(manifest), "--intermediates", "sync", "--force")
+    if not (parsed.exists() and normalized.exists()):
+        fail("run --intermediates sync did not write parsed/normalized artifacts")
+    engine(root, "run", "--source", str(manifest), "--intermediates", "skip", "--force")
+    if not candidate.exists():
+        fail("run --intermediates skip did not write the candidate")
+    if parsed.exists() or normalized.exists():
+        fail("run --intermediates skip left parsed/normalized artifacts from the earlier run")
+    cache = root / "governance" / "ingestion" / "cache"
+    stale = sorted(p.name for p in cache.glob(f"{SRC_ID}.*.v1.json"))
+    if stale:
+        fail(f"run --intermediates skip left stage cache records: {stale}")
+    if stage_cache_hits(root, manifest) != dict.fromkeys(STAGES, False):
+        fail("stages after run --intermediates skip should rebuild from scratch")
+
+
+def check_merge_keeps_source_status(root: Path) -> None:
+    manifest, _, _, _ = source_paths(root, SRC_ID)
+    sources_dir = manifest.parent
+    doc = json.loads(manifest.read_text(encoding="utf-8"))
+    # A second source of the same organization whose publication mode conflicts
+    # with the sample's, so the merged IR carries conflict hints the sample lacks.
+    payload = root / "control" / "ingestion" / "examples" / "source-payloads" / "validate-ingestion-second.md"
+    payload.parent.mkdir(parents=True, exist_ok=True)
+    payload.write_text("- RULE publication_restriction mode=allow_with_review\n", encoding="utf-8")
+    second = {**doc, "source_id": "src.sample.validate-second", "source_payload_ref": str(payload.relative_to(root))}
+    (sources_dir / "src.sample.validate-second.source.v1.json").write_text(json.dumps(second, indent=2) + "\n", encoding="utf-8")
+    for source_id in (SRC_ID, "src.sample.validate-second"):
+        cli(root, "pipeline", "run", source_id)
+
+    before = cli(root, "status", SRC_ID, "--format", "json")
+    engine(root, "merge", "--sources-dir", str(sources_dir), "--organization", doc["owner"]["organization_id"])
+    after = cli(root, "status", SRC_ID, "--format", "json")
+    if after != before:
+        fail(f"status {SRC_ID} changed after merge\n--- before\n{before}--- after\n{after}")
+
+
+def check_writer_recreates_dirs(root: Path) -> None:
+    # One engine process, as in `watch`: a directory removed after the writer
+    # has used it must be recreated on the next write.
+    manifest, parsed, _, _ = source_paths(root, SRC_ID)
+    script = (
+        "import shutil, sys; from pathlib import Path; sys.path.insert(0, 'tools/gen'); "
+        "import deterministic_governance_ingestion as e; "
+        f"src = Path({str(manifest)!r}); e.run_stage('parse', src, True); "
+        f"shutil.rmtree({str(parsed.parent)!r}); e.run_stage('parse', src, True)"
+    )
+    proc = subprocess.run([sys.executable, "-c", script], cwd=str(root), capture_output=True, text=True)
+    if proc.returncode != 0 or not parsed.exists():
+        fail(f"artifact writer did not recreate a removed directory\n{proc.stdout}{proc.stderr}")
+
+
+def parsed_ids(root: Path) -> List[str]:
+    return [r["parsed_id"] for r in json.loads(cli(root, "parsed", "list", "--format", "json"))]
+
+
+def check_artifact_index(root: Path) -> None:
+    index = root / "governance" / "ingestion" / "cache" / "yai-govern-index.v1.json"
+    manifest, parsed, _, _ = source_paths(root, SRC_ID)
+    cli(root, "source", "list")
+    cli(root, "parsed", "list")
+    if not index.exists():
+        fail("artifact index: yai-govern did not write its index")
+
+    # Artifacts written by the engine outside the CLI are picked up.
+    extra = parsed.with_name("src.sample.validate-index.parsed.v1.json")
+    doc = json.loads(parsed.read_text(encoding="utf-8"))
+    doc["source_ref"] = "src.sample.validate-index"
+    extra.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+    if "src.sample.validate-index" not in parsed_ids(root):
+        fail("artifact index: missed a parsed artifact written outside yai-govern")
+
+    # An artifact rewritten in place is re-read (engine output with the same name).
+    doc["facts"] = doc["facts"][:1]
+    extra.write_text(json.dumps(doc) + "\n", encoding="utf-8")
+    rows = json.loads(cli(root, "parsed", "list", "--format", "json"))
+    if [r["facts"] for r in rows if r["parsed_id"] == "src.sample.validate-index"] != [1]:
+        fail("artifact index: served a stale summary for a rewritten artifact")
+    engine(root, "parse", "--source", str(manifest), "--force")
+    if SRC_ID not in parsed_ids(root):
+        fail("artifact index: lost an artifact rewritten by the engine")
+
+    # Deleted artifacts drop out.
+    extra.unlink()
+    if "src.sample.validate-index" in parsed_ids(root):
+        fail("artifact index: still lists a deleted artifact")
+
+    # A corrupt, truncated or older index is rebuilt from the directories.
+    expected = parsed_ids(root)
+    current = json.loads(index.read_text(encoding="utf-8"))
+    older = {**current, "schema_version": "v1"}
+    older["dirs"] = {
+        name: {fname: {k: v for k, v in row.items() if k != "summary"} for fname, row in rows.items()}
+        for name, rows in current["dirs"].items()
+    }
+    for broken in ("{not json", json.dumps(current)[:40], json.dumps(older)):
+        index.write_text(broken, encoding="utf-8")
+        if parsed_ids(root) != expected:
+            fail(f"artifact index: wrong listing from a damaged index {broken[:20]!r}")
+        if json.loads(index.read_text(encoding="utf-8"))["dirs"]["parsed"] != current["dirs"]["parsed"]:
+            fail(f"artifact index: damaged index {broken[:20]!r} was not rebuilt")
+    if "src.sample.digital-outbound" not in cli(root, "status", SRC_ID):
+        fail("artifact index: status lookup failed after an index rebuild")
+
+
+def check_stage_commands_json(root: Path) -> None:
+    # stdout must be exactly one JSON document (ndjson: one per line), with no
+    # progress or artifact-path lines around it.
+    slug = SRC_ID.replace(".", "-")
+    for args in (("parse", SRC_ID), ("normalize", SRC_ID), ("build", f"norm.{slug}")):
+        for fmt in ("json", "ndjson"):
+            out = cli(root, *args, "--format", fmt)
+            try:
+                docs = [json.loads(out)] if fmt == "json" else [json.loads(line) for line in out.splitlines()]
+            except ValueError:
+                fail(f"yai-govern {' '.join(args)} --format {fmt} printed non-JSON output:\n{out}")
+            if len(docs) != 1 or not isinstance(docs[0], dict):
+                fail(f"yai-govern {' '.join(args)} --format {fmt} should print one JSON object:\n{out}")
+
+
+def load_cli_module(root: Path) -> ModuleType:
+    loader = importlib.machinery.SourceFileLoader("yai_govern_cli", str(root / "tools" / "bin" / "yai-govern"))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    sys.modules[loader.name] = module  # dataclasses resolve annotations through sys.modules
+    loader.exec_module(module)
+    return module
+
+
+# Hand-written documents for JsonSummaryScanner edge cases: escapes, nesting,
+# numbers that can straddle a chunk boundary, empty containers.
+SCANNER_DOCS = (
+    '{}',
+    ' \n{ "facts" : [ ] }\n',
+    '{"facts":7,"unresolved_items":[[],[[1]],{"a":[2]}]}',
+    '{"kind":"k","n":12345678901234567890123,"x":-0.5e-3,"facts":[1,2.5E10,true,null,"s\\"],{\\u00e9"],"t":false}',
+    '{"s":"line\\nbreak \\u2603 \\ud83d\\ude00","facts":[{"nested":{"deep":[1,{"k":"}]"}]}}],"z":[]}',
+)
+SCANNER_CHUNKS = (1, 2, 3, 5, 7, 64, 1 << 16)
+
+
+def expected_summary(doc: Dict[str, Any], counted: Iterable[str], counts_key: str) -> Dict[str, Any]:
+    counted = set(counted)
+    out = {k: v for k, v in doc.items() if not (k in counted and isinstance(v, list))}
+    out[counts_key] = {k: len(v) for k, v in doc.items() if k in counted and isinstance(v, list)}
+    return out
+
+
+def check_summary_scanner(root: Path) -> None:
+    cli_mod = load_cli_module(root)
+    scanner = cli_mod.JsonSummaryScanner
+    counted_by_kind = cli_mod.sidecars.SUMMARY_COUNTED
+    cases: List[Tuple[str, str, Tuple[str, ...]]] = [
+        (f"case {i}", text, ("facts", "unresolved_items")) for i, text in enumerate(SCANNER_DOCS)
+    ]
+    for path in sorted((root / "governance" / "ingestion").glob("*/*.json")):
+        text = path.read_text(encoding="utf-8")
+        doc = json.loads(text)
+        if isinstance(doc, dict):
+            cases.append((str(path.relative_to(root)), text, counted_by_kind.get(doc.get("kind"), ())))
+    for name, text, counted in cases:
+        expected = expected_summary(json.loads(text), counted, cli_mod.SUMMARY_COUNTS)
+        for chunk in SCANNER_CHUNKS:
+            try:
+                got = scanner(io.StringIO(text), chunk).summary(counted)
+            except ValueError as exc:
+                fail(f"summary scanner: {name} at chunk size {chunk} rejected: {exc}")
+            if got != expected:
+                fail(f"summary scanner: {name} at chunk size {chunk} differs from json.load")
+
+    # Truncated or invalid JSON must raise ValueError (never return a partial summary).
+    text = (root / "governance" / "ingestion" / "parsed" / f"{SRC_ID}.parsed.v1.json").read_text(encoding="utf-8")
+    broken = [text[:cut] for cut in (1, len(text) // 3, len(text) // 2, len(text) - 3)]
+    broken += ["", "[]", '{"a":1,}', '{"a" 1}', '{"facts":[1 2]}', '{"a":tru}', '{"a":1},', '{"a":1} {}', '{"a":"unterminated}']
+    for bad in broken:
+        for chunk in (1, 7, 1 << 16):
+            try:
+                scanner(io.StringIO(bad), chunk).summary(("facts",))
+            except ValueError:
+                continue
+            fail(f"summary scanner: accepted invalid JSON {bad[:40]!r} at chunk size {chunk}")
+
+    # yai-govern falls back to skipping an unreadable artifact, as json.load did.
+    truncated = root / "governance" / "ingestion" / "parsed" / "src.sample.validate-truncated.parsed.v1.json"
+    truncated.write_text(text[: len(text) // 2], encoding="utf-8")
+    ids = parsed_ids(root)
+    if SRC_ID not in ids or "src.sample.validate-truncated" in ids:
+        fail(f"summary scanner: parsed list with a truncated artifact listed {ids}")
+
+
+def check_sidecar_summary(root: Path) -> None:
+    cli_mod = load_cli_module(root)
+    sidecars = cli_mod.sidecars
+    manifest, parsed, normalized, _ = source_paths(root, SRC_ID)
+    engine(root, "--sidecars", "run", "--source", str(manifest), "--force")
+    engine(root, "--sidecars", "parse", "--source", str(manifest), "--force")
+
+    def expected(path: Path) -> Dict[str, Any]:
+        doc = json.loads(path.read_text(encoding="utf-8"))
+        return expected_summary(doc, sidecars.SUMMARY_COUNTED.get(doc["kind"], ()), cli_mod.SUMMARY_COUNTS)
+
+    # parse streams facts through SidecarWriter.tee_list; normalize goes through write_sidecar.
+    for path, kind in ((parsed, "governance_parsed_facts"), (normalized, "enterprise_governance_normalized")):
+        if not sidecars.sidecar_path(path).is_file():
+            fail(f"sidecar summary: --sidecars wrote no sidecar for {path.name}")
+        if cli_mod.read_summary_doc(path, kind) != expected(path):
+            fail(f"sidecar summary: read_summary of {path.name} differs from json.load")
+    path = root / "sidecar-roundtrip.json"
+    doc = {
+        "kind": "governance_parsed_facts",
+        "n": 1 << 70,
+        "x": -0.5e-3,
+        "s": "caf\u00e9 \u2603 \U0001f600",
+        "nested": {"a": [1, [2, {"b": None}]], "t": True},
+        "facts": [{"id": i} for i in range(3)],
+    }
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    sidecars.write_sidecar(path, doc)
+    if cli_mod.read_summary_doc(path, doc["kind"]) != expected(path):
+        fail("sidecar summary: write_sidecar -> read_summary does not round-trip")
+
+    # A touched or rewritten JSON makes the sidecar stale; readers fall back to the scanner.
+    st = parsed.stat()
+    os.utime(parsed, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    if sidecars.read_summary(parsed) is not None:
+        fail("sidecar summary: a touched artifact still served its sidecar summary")
+    doc = json.loads(parsed.read_text(encoding="utf-8"))
+    doc["facts"] = doc["facts"][:1]
+    parsed.write_text(json.dumps(doc, indent=2), encoding="utf-8")
+    if sidecars.read_summary(parsed) is not None:
+        fail("sidecar summary: a rewritten artifact still served its sidecar summary")
+    summary = cli_mod.read_artifact_summary(parsed, "governance_parsed_facts")
+    if summary != expected(parsed) or summary[cli_mod.SUMMARY_COUNTS]["facts"] != 1:
+        fail("sidecar summary: a stale sidecar did not fall back to the JSON scanner")
+    engine(root, "--sidecars", "parse", "--source", str(manifest))
+    if cli_mod.read_summary_doc(parsed, "governance_parsed_facts") != expected(parsed):
+        fail("sidecar summary: parse --sidecars did not refresh a stale sidecar")
+    # A stage cache hit backfills a missing sidecar.
+    sidecars.sidecar_path(parsed).unlink()
+    engine(root, "--sidecars", "parse", "--source", str(manifest))
+    if cli_mod.read_summary_doc(parsed, "governance_parsed_facts") != expected(parsed):
+        fail("sidecar summary: a stage cache hit did not backfill a missing sidecar")
+
+
+SCRATCH_CHECKS = (
+    ("stage cache", check_stage_cache),
+    ("run --intermediates skip", check_run_skip_intermediates),
+    ("status after merge", check_merge_keeps_source_status),
+    ("writer recreates removed directories", check_writer_recreates_dirs),
+    ("artifact index", check_artifact_index),
+    ("stage commands --format json|ndjson", check_stage_commands_json),
+    ("summary scanner", check_summary_scanner),
+    ("sidecar summary", check_sidecar_summary),
+)
+
+
 def main() -> int:
     if not CLI.exists():
         print(f"[ingestion-cli] FAIL: missing {CLI.relative_to(ROOT)}")
@@ -44,6 +432,11 @@ def main() -> int:
             print(f"[ingestion-cli] FAIL: {' '.join(c)} rc={rc}")
             return 1
 
+    for name, check in SCRATCH_CHECKS:
+        with tempfile.TemporaryDirectory(prefix="yai-ingestion-cli.") as tmp:
+            check(scratch_root(Path(tmp)))
+        print(f"[ingestion-cli] OK {name}")
+
     print("[ingestion-cli] OK")
     return 0
 